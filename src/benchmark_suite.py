@@ -0,0 +1,165 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import time
+
+import numpy as np
+
+from optimization import adjacency_matrix, adj_matrix_strict, trans_closure, warshall, minimal_cycles, \
+    minimal_diamond, minimal_small, ebo, EBOStreamTracker, set_subtraction, create_random_points, set_backend, \
+    get_backend
+
+
+def digest_all(data_set, sigma):
+    """
+    Digests a data set point by point, as the scripts do.
+    """
+    tracker = EBOStreamTracker(sigma)
+    for i in range(len(data_set)):
+        tracker.digest(data_set[i, :])
+    return tracker
+
+
+def digest_block(data_set, sigma):
+    """
+    Digests a data set as one block.
+    """
+    tracker = EBOStreamTracker(sigma)
+    tracker.digest_many(data_set)
+    return tracker
+
+
+# name, function of (data_set, sigma, prepared input), preparation of the input outside of the timing, largest n
+BENCHMARKS = [
+    ('adjacency_matrix', lambda data_set, sigma, prepared: adjacency_matrix(data_set, sigma), None, 10 ** 4),
+    ('trans_closure', lambda data_set, sigma, prepared: trans_closure(prepared),
+     lambda data_set, sigma: adj_matrix_strict(adjacency_matrix(data_set, sigma)), 10 ** 3),
+    ('warshall', lambda data_set, sigma, prepared: warshall(prepared),
+     lambda data_set, sigma: adj_matrix_strict(adjacency_matrix(data_set, sigma)), 10 ** 2),
+    ('minimal_cycles', lambda data_set, sigma, prepared: minimal_cycles(data_set, sigma), None, 10 ** 3),
+    ('minimal_diamond', lambda data_set, sigma, prepared: minimal_diamond(data_set, sigma), None, 10 ** 4),
+    ('minimal_small', lambda data_set, sigma, prepared: minimal_small(data_set, sigma), None, 10 ** 4),
+    ('ebo', lambda data_set, sigma, prepared: ebo(data_set, sigma), None, 10 ** 4),
+    ('EBOStreamTracker.digest', lambda data_set, sigma, prepared: digest_all(data_set, sigma), None, 10 ** 4),
+    ('EBOStreamTracker.digest_many', lambda data_set, sigma, prepared: digest_block(data_set, sigma), None, 10 ** 4),
+    ('set_subtraction', lambda data_set, sigma, prepared: set_subtraction(data_set, prepared),
+     lambda data_set, sigma: data_set[::2, :].copy(), 10 ** 4),
+]
+
+
+def time_benchmark(function, data_set, sigma, prepared, repeat):
+    """
+    Measures the wall time of repeated calls of one benchmark. One untimed call comes first, so compiling the numba
+    kernels is not part of the timings.
+    :return: list of elapsed seconds
+    """
+    function(data_set, sigma, prepared)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(data_set, sigma, prepared)
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def execute(samples, dims, sigmas, repeat, names=None):
+    """
+    Runs every benchmark on random data sets for all combinations of n, dim and sigma.
+    :param samples: data set sizes n
+    :param dims: numbers of objectives
+    :param sigmas: thresholds, used for every objective
+    :param repeat: number of timed calls per combination
+    :param names: names of the benchmarks to run, all if None
+    :return: list of result dictionaries
+    """
+    results = []
+
+    for n, dim, threshold in itertools.product(samples, dims, sigmas):
+        data_set = create_random_points(dim, n, random_state=np.random.RandomState([n, dim]))
+        sigma = [threshold] * dim
+
+        for name, function, prepare, max_size in BENCHMARKS:
+            if (names is not None and name not in names) or n > max_size:
+                continue
+
+            prepared = prepare(data_set, sigma) if prepare is not None else None
+            timings = time_benchmark(function, data_set, sigma, prepared, repeat)
+            results.append({'name': name, 'n': n, 'dim': dim, 'sigma': threshold, 'timings': timings,
+                            'min': min(timings), 'median': float(np.median(timings))})
+            print(f'{name} n={n} dim={dim} sigma={threshold}: {min(timings):.6f}s')
+
+    return results
+
+
+def save_results(results, file_name):
+    """
+    Saves the results together with the environment they were measured in.
+    """
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'backend': get_backend(),
+        'results': results,
+    }
+
+    directory = os.path.dirname(file_name)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    with open(file_name, 'w') as file:
+        json.dump(report, file, indent=2)
+
+
+def compare(baseline_file, current_file):
+    """
+    Prints the ratio of the minimal wall times of two saved runs for every benchmark present in both.
+    """
+    with open(baseline_file) as file:
+        baseline = json.load(file)['results']
+    with open(current_file) as file:
+        current = json.load(file)['results']
+
+    def key(result):
+        return result['name'], result['n'], result['dim'], result['sigma']
+
+    baseline = {key(result): result['min'] for result in baseline}
+
+    for result in current:
+        if key(result) in baseline:
+            print(f'{result["name"]} n={result["n"]} dim={result["dim"]} sigma={result["sigma"]}: '
+                  f'{baseline[key(result)] / result["min"]:.2f}x')
+
+
+def main():
+    file_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'benchmarks')
+
+    parser = argparse.ArgumentParser(description='Benchmark suite of the optimization package')
+    parser.add_argument('--output', default=os.path.join(file_path, 'results.json'), help='JSON file of the results')
+    parser.add_argument('--backend', default='python', help='kernel backend, python or numba')
+    parser.add_argument('--benchmark', action='append', help='run only this benchmark, can be given several times')
+    parser.add_argument('--quick', action='store_true', help='small grid for a smoke test')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON file of an earlier run to compare against')
+    arguments = parser.parse_args()
+
+    set_backend(arguments.backend)
+
+    if arguments.quick:
+        samples, dims, sigmas, repeat = [10 ** 2], [2], [0.1], 1
+    else:
+        samples, dims, sigmas, repeat = [10 ** 2, 10 ** 3, 10 ** 4], [2, 3], [0.05, 0.1, 0.2], 3
+
+    results = execute(samples, dims, sigmas, repeat, arguments.benchmark)
+    save_results(results, arguments.output)
+
+    if arguments.compare:
+        compare(arguments.compare, arguments.output)
+
+
+if __name__ == "__main__":
+    main()
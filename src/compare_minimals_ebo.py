@@ -5,7 +5,7 @@ import numpy as np
 from PIL import Image
 from matplotlib.lines import Line2D
 
-from optimization import minimal_cycles, set_subtraction, ebo, get_data_from_csv
+from optimization import BottomCycleTracker, set_subtraction, ebo, get_data_from_csv
 
 
 def make_plots(data_set, minimals, slack, step):
@@ -84,9 +84,14 @@ def main():
 
     images = []
 
+    # bottom cycles are updated with one new element per step instead of recomputed for each prefix
+    cycle_tracker = BottomCycleTracker(sigma)
+
     for i in range(1, n + 1):
-        data_set = data_values[:i, :]
-        minimals = minimal_cycles(data_set, sigma)
+        if i <= len(data_values):
+            cycle_tracker.digest(data_values[i - 1, :])
+        data_set = cycle_tracker.data_set
+        minimals = cycle_tracker.minimals
 
         im = make_plots(data_set, minimals, sigma, i)
         images.append(im)
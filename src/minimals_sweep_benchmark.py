@@ -0,0 +1,91 @@
+import os
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from optimization import minimal_diamond, minimal_small, create_random_points
+
+
+def time_method(minimal, data_set, sigma, method):
+    """
+    Measures the wall time of one call of a minimal set function.
+    :return: elapsed seconds and the minimal set
+    """
+    start = time.perf_counter()
+    minimals = minimal(data_set, sigma, method=method)
+    return time.perf_counter() - start, minimals
+
+
+def execute(samples, dim, sigma, max_matrix_size):
+    """
+    Times the sort-and-sweep and the adjacency matrix implementations of minimal_diamond and minimal_small. The
+    matrix implementation needs n x n booleans and is skipped above max_matrix_size.
+    :return: dictionary of timings per function and method
+    """
+    timings = {(minimal.__name__, method): [] for minimal in [minimal_diamond, minimal_small]
+               for method in ['sweep', 'matrix']}
+
+    for n in samples:
+        data_set = create_random_points(dim, n)
+        for minimal in [minimal_diamond, minimal_small]:
+            sweep_time, sweep_minimals = time_method(minimal, data_set, sigma, 'sweep')
+            timings[(minimal.__name__, 'sweep')].append(sweep_time)
+
+            if n > max_matrix_size:
+                timings[(minimal.__name__, 'matrix')].append(np.nan)
+                print(f'{minimal.__name__} n={n}: sweep {sweep_time:.4f}s, matrix skipped')
+                continue
+
+            matrix_time, matrix_minimals = time_method(minimal, data_set, sigma, 'matrix')
+            timings[(minimal.__name__, 'matrix')].append(matrix_time)
+            assert np.array_equal(sweep_minimals, matrix_minimals)
+            print(f'{minimal.__name__} n={n}: sweep {sweep_time:.4f}s, matrix {matrix_time:.4f}s')
+
+    return timings
+
+
+def make_plot(timings, samples):
+    """
+    Plots the wall time of each implementation versus the sample size.
+    """
+    plt.style.use("ggplot")
+
+    plt.xlabel("Sample size")
+    plt.ylabel("Wall time [s]")
+    plt.xscale('log')
+    plt.yscale('log')
+
+    for (name, method), values in timings.items():
+        plt.plot(samples, values, '--' if method == 'matrix' else '-', linewidth=1, marker='.',
+                 label=f'{name} ({method})')
+
+    plt.title('Sort-and-sweep versus adjacency matrix', pad=10)
+    plt.legend(loc='upper left')
+
+    plt.grid(True)
+
+    file_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'plots', 'benchmarks')
+    if not os.path.isdir(file_path):
+        os.makedirs(file_path)
+
+    plt.savefig(os.path.join(file_path, 'minimals_sweep.png'))
+    plt.close()
+
+
+def main():
+    dim = 3
+    sigma = [0.1, 0.1, 0.1]
+    samples = [10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5]
+
+    # 10^5 x 10^5 booleans do not fit in memory
+    max_matrix_size = 10 ** 4
+
+    np.random.seed(0)
+
+    timings = execute(samples, dim, sigma, max_matrix_size)
+    make_plot(timings, samples)
+
+
+if __name__ == "__main__":
+    main()
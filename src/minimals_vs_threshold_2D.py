@@ -2,26 +2,46 @@ import os
 
 import matplotlib.pyplot as plt
 import matplotlib2tikz
-import numpy as np
 import pandas as pd
 import seaborn as sns
 from matplotlib.lines import Line2D
 
-from optimization import minimal_cycles
+from optimization import minimal_cycles, run_experiment, ThresholdSweep
 from optimization.helpers import set_subtraction, create_random_points
 
 
+def trial(cell, random_state):
+    """
+    Counts the minimal elements of one random data set.
+    :param cell: (n, dim, sigma)
+    :param random_state: random number generator of this execution
+    :return: number of minimal elements
+    """
+    n, dim, sigma = cell
+    data_set = create_random_points(dim, n, random_state)
+    minimals = minimal_cycles(data_set, sigma)
+
+    if (len(minimals) / n > 0.8) and ((sigma[0] < 0.4) or (sigma[0] < 0.4)):
+        plot_cycles(data_set, minimals, sigma)
+
+    return len(minimals)
+
+
 def execute(n, dim, executions, sigma):
-    number_minimals = []
-    for j in range(executions):
-        data_set = create_random_points(dim, n)
-        minimals = minimal_cycles(data_set, sigma)
+    return run_experiment(trial, [(n, dim, sigma)], executions)[0]
 
-        number_minimals.append(len(minimals))
-        if (len(minimals) / n > 0.8) and ((sigma[0] < 0.4) or (sigma[0] < 0.4)):
-            plot_cycles(data_set, minimals, sigma)
 
-    return np.min(number_minimals), np.mean(number_minimals), np.max(number_minimals)
+def sweep_trial(cell, random_state):
+    """
+    Counts the minimal elements of one random data set for every cell of the threshold grid.
+    :param cell: (n, dim, slacks)
+    :param random_state: random number generator of this execution
+    :return: number of minimal elements per grid cell in row-major order
+    """
+    n, dim, slacks = cell
+    data_set = create_random_points(dim, n, random_state)
+
+    return tuple(ThresholdSweep(data_set, [slacks] * dim).count_minimals().ravel())
 
 
 def plot_cycles(data_set, minimals, slack):
@@ -100,7 +120,12 @@ def plot_heatmap(data_frame: pd.DataFrame, slacks, title: str, plot_type):
         matplotlib2tikz.save(file_path + '/' + title + ".tex")
 
 
-def generate_data(stop, increment):
+def generate_data(stop, increment, sweep=False):
+    """
+    Computes the minimal set size statistics for all threshold combinations.
+    :param sweep: evaluate the whole grid on each random data set with a ThresholdSweep instead of drawing new data sets
+    for every grid cell, no cycle plots are created in this mode
+    """
     dim = 2
     n = 10
 
@@ -109,20 +134,22 @@ def generate_data(stop, increment):
     overall_min = []
     overall_mean = []
     overall_max = []
-    slack_string = []
+    slacks = [i / stop for i in range(0, stop + increment, increment)]
 
-    for i in range(0, stop + increment, increment):
-        slack1 = i / stop
-        slack_string.append(slack1)
+    if sweep:
+        summary = run_experiment(sweep_trial, [(n, dim, slacks)], executions)[0]
+        results = iter(zip(summary[0::3], summary[1::3], summary[2::3]))
+    else:
+        # all cells of the grid are distributed over the worker processes at once
+        cells = [(n, dim, [slack1, slack2]) for slack1 in slacks for slack2 in slacks]
+        results = iter(run_experiment(trial, cells, executions))
+
+    for slack1 in slacks:
         number_min = []
         number_mean = []
         number_max = []
-        for q in range(0, stop + increment, increment):
-            slack2 = q / stop
-            sigma = [slack1, slack2]
-
-            min, mean, max = execute(n, dim, executions, sigma)
-            print(sigma)
+        for slack2 in slacks:
+            min, mean, max = next(results)
 
             number_min.append(min / n)
             number_mean.append(mean / n)
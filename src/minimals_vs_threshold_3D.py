@@ -2,9 +2,23 @@ import os
 
 import matplotlib.pyplot as plt
 import matplotlib2tikz
-import numpy as np
 
-from optimization import minimal_cycles, minimal_diamond, minimal_small, create_random_points
+from optimization import SemiorderRelation, create_random_points, run_experiment
+
+
+def trial(cell, random_state):
+    """
+    Evaluates the minimal sets of one random data set.
+    :param cell: (n, dim, sigma)
+    :param random_state: random number generator of this execution
+    :return: number of minimal elements, 1 if minimal_small is non-empty, 1 if minimal_diamond is non-empty
+    """
+    n, dim, sigma = cell
+    data_set = create_random_points(dim, n, random_state)
+    relation = SemiorderRelation(data_set, sigma)
+    minimals = relation.minimal_cycles()
+
+    return len(minimals), float(len(relation.minimal_small()) > 0), float(len(relation.minimal_diamond()) > 0)
 
 
 def execute(n, dim, executions, sigma):
@@ -16,21 +30,17 @@ def execute(n, dim, executions, sigma):
     :param sigma:
     :return:
     """
-    number_minimals = []
-    mins = 0.0
-    minimal_dia = 0.0
+    return _merge(run_experiment(trial, [(n, dim, sigma)], executions)[0], executions)
 
-    for j in range(executions):
-        data_set = create_random_points(dim, n)
-        minimals = minimal_cycles(data_set, sigma)
 
-        number_minimals.append(len(minimals))
-        if len(minimal_diamond(data_set, sigma)) > 0:
-            minimal_dia = minimal_dia + 1.0
-        if len(minimal_small(data_set, sigma)) > 0:
-            mins = mins + 1.0
+def _merge(result, executions):
+    """
+    Converts the min/mean/max statistics of a cell into the minimal set size statistics and the number of executions
+    with non-empty minimal_small and minimal_diamond.
+    """
+    min, mean, max, _, small_mean, _, _, diamond_mean, _ = result
 
-    return np.min(number_minimals), np.mean(number_minimals), np.max(number_minimals), mins, minimal_dia
+    return min, mean, max, small_mean * executions, diamond_mean * executions
 
 
 def make_plot_num_comps(numbers_min, numbers_mean, numbers_max, slack, plot_type):
@@ -145,15 +155,13 @@ def main():
     percentage_min = []
     percentage_dia = []
 
-    sigmas = []
+    sigmas = [i / stop for i in range(start, stop + increment, increment)]
 
-    for i in range(start, stop + increment, increment):
-        slack = i / stop
-        print(slack)
-        sigmas.append(slack)
-        sigma = [slack, slack, slack]
+    cells = [(n, dim, [slack, slack, slack]) for slack in sigmas]
+    results = run_experiment(trial, cells, executions)
 
-        min, mean, max, mins, min_dia = execute(n, dim, executions, sigma)
+    for result in results:
+        min, mean, max, mins, min_dia = _merge(result, executions)
 
         number_min.append(min / n)
         number_mean.append(mean / n)
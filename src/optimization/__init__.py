@@ -1,3 +1,14 @@
+from .backend import *
 from .helpers import *
+from .packed import *
 from .minimals import *
 from .ebo_stream import *
+from .mintracker import *
+from .experiments import *
+from .cycletracker import *
+from .sweep import *
+from .pipeline import *
+from .topk import *
+from .window import *
+from .multisigma import *
+from .service import *
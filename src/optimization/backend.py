@@ -0,0 +1,67 @@
+import functools
+from typing import *
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+BACKENDS = ['python', 'numba']
+
+_backend = 'python'
+_compiled = {}
+
+
+def set_backend(name: str):
+    """
+    Selects the implementation of the scalar kernels, i.e. warshall and the block loop of EBOStreamTracker.digest_many.
+    'python' runs the plain Python code, 'numba' compiles the same code on first use. lex_semiorder_comparison and the
+    single point EBOStreamTracker.digest always run in Python, a single call gains less than the dispatch costs.
+    :param name: 'python' or 'numba'
+    :return:
+    """
+    global _backend
+
+    if name not in BACKENDS:
+        raise ValueError(f'unknown backend {name}, expected one of {BACKENDS}')
+    if name == 'numba' and numba is None:
+        raise ImportError('the numba backend requires numba to be installed')
+
+    _backend = name
+
+
+def get_backend():
+    """
+    Returns the name of the selected backend.
+    """
+    return _backend
+
+
+def compiled(function: Callable):
+    """
+    Returns the numba compiled version of a kernel, compiling it on first use.
+    :param function: plain Python kernel
+    :return: compiled kernel
+    """
+    if function not in _compiled:
+        _compiled[function] = numba.njit(function)
+    return _compiled[function]
+
+
+def kernel(function: Callable):
+    """
+    Decorator dispatching a kernel to the selected backend. Lists are passed to compiled kernels as arrays.
+    :param function: plain Python kernel
+    :return: dispatching function
+    """
+
+    @functools.wraps(function)
+    def dispatch(*args):
+        if _backend == 'numba':
+            return compiled(function)(*[np.asarray(arg, dtype=float) if isinstance(arg, list) else arg
+                                        for arg in args])
+        return function(*args)
+
+    return dispatch
@@ -0,0 +1,231 @@
+from typing import *
+
+import numpy as np
+
+from .mintracker import strict_precedence
+from .packed import WORD_SIZE, pack_rows, unpack_rows
+
+
+class BottomCycleTracker:
+    """BottomCycleTracker which keeps track of the bottom cycles of a growing set X, one input element at a time. The
+    result after each digest is the same as minimal_cycles on all elements digested so far.
+
+    The tracker keeps the strongly connected components of <X,P> and the transitive closure of the condensation, which
+    is a DAG, as bit-packed rows in both directions: the components each component reaches and the components reaching
+    it. A new element only requires its own row and column of P: the components reaching it and the components
+    reachable from it are the OR of a few rows, the new element's bits are added to the rows of exactly these
+    components, and the components on both sides are merged with the new element into one component. An element is
+    minimal iff no other component reaches its component, which is kept as a flag per component.
+
+    Merged components leave their ids unused, the ids are renumbered when they run out instead of growing the rows.
+    """
+
+    def __init__(self, sigma: List[float], initial_capacity: int = 16):
+        self.sigma = sigma
+        self.dim = len(sigma)
+
+        # elements in order of arrival and the component of each element
+        self._data = np.empty((initial_capacity, self.dim))
+        self._component = np.empty(initial_capacity, dtype=int)
+        self._size = 0
+
+        # bit b of _reach[a] is set iff component a reaches component b, bit a of _reached_by[b] likewise; the first
+        # _number_ids ids are in use, those of merged components are no longer alive
+        self._reach = _zero_rows(initial_capacity)
+        self._reached_by = _zero_rows(initial_capacity)
+        self._alive = np.zeros(initial_capacity, dtype=bool)
+        # components reached by another component, i.e. with an in-edge in the condensation
+        self._has_ancestor = np.zeros(initial_capacity, dtype=bool)
+        self._number_ids = 0
+
+    @property
+    def data_set(self):
+        """
+        All elements digested so far, in order of arrival.
+        """
+        return self._data[:self._size, :]
+
+    @property
+    def index_filter(self):
+        """
+        Boolean index filter of the minimal elements of data_set.
+        """
+        return np.invert(self._has_ancestor[self._component[:self._size]])
+
+    @property
+    def minimals(self):
+        """
+        Minimal elements, e.g. bottom cycles, of all elements digested so far.
+        """
+        return self.data_set[self.index_filter, :]
+
+    def digest(self, x: np.ndarray):
+        """
+        Updates the tracker when a new input element is available.
+        :param x: new input element
+        :return:
+        """
+        x = np.reshape(x, (self.dim,))
+        n = self._size
+
+        self._reserve(n + 1)
+        c = self._number_ids
+
+        data_set = self._data[:n, :]
+        component = self._component[:n]
+
+        # components with an element strictly preceding x and components with an element strictly preceded by x
+        into = np.unique(component[strict_precedence(data_set, x, self.sigma)])
+        out = np.unique(component[strict_precedence(x, data_set, self.sigma)])
+
+        ancestors = _set_bits(self._words(), into) | _or_rows(self._reached_by, into)
+        descendants = _set_bits(self._words(), out) | _or_rows(self._reach, out)
+        ancestor_ids = self._ids(ancestors)
+        descendant_ids = self._ids(descendants)
+
+        # every new path passes through x
+        self._reach[c, :] = descendants
+        self._reached_by[c, :] = ancestors
+        self._reach[ancestor_ids, :] |= descendants
+        self._reached_by[descendant_ids, :] |= ancestors
+        _add_bit(self._reach, ancestor_ids, c)
+        _add_bit(self._reached_by, descendant_ids, c)
+
+        self._alive[c] = True
+        self._has_ancestor[c] = len(ancestor_ids) > 0
+        self._has_ancestor[descendant_ids] = True
+        self._number_ids = c + 1
+
+        self._data[n, :] = x
+        self._component[n] = c
+        self._size = n + 1
+
+        # components both reaching and reachable from x form a cycle with x
+        merged = self._ids(ancestors & descendants)
+        if len(merged):
+            self._merge(c, merged)
+
+    def _words(self):
+        """
+        Number of words of a packed row.
+        """
+        return self._reach.shape[1]
+
+    def _ids(self, row: np.ndarray):
+        """
+        Component ids whose bits are set in a packed row.
+        """
+        return np.flatnonzero(unpack_rows(row[np.newaxis, :], len(self._alive))[0])
+
+    def _merge(self, representative: int, members: np.ndarray):
+        """
+        Merges the components members into the component representative, keeping the closure of the condensation.
+        :param representative: id of the merged component
+        :param members: ids of the other components to merge
+        :return:
+        """
+        member_bits = _set_bits(self._words(), np.append(members, representative))
+
+        reach = (self._reach[representative, :] | _or_rows(self._reach, members)) & ~member_bits
+        reached_by = (self._reached_by[representative, :] | _or_rows(self._reached_by, members)) & ~member_bits
+        self._reach[representative, :] = reach
+        self._reached_by[representative, :] = reached_by
+
+        # the rows of the components on both sides refer to the representative instead of the members
+        ancestor_ids = self._ids(reached_by)
+        descendant_ids = self._ids(reach)
+        self._reach[ancestor_ids, :] &= ~member_bits
+        self._reached_by[descendant_ids, :] &= ~member_bits
+        _add_bit(self._reach, ancestor_ids, representative)
+        _add_bit(self._reached_by, descendant_ids, representative)
+
+        self._reach[members, :] = 0
+        self._reached_by[members, :] = 0
+        self._alive[members] = False
+        self._has_ancestor[members] = False
+        self._has_ancestor[representative] = len(ancestor_ids) > 0
+
+        in_members = np.zeros(self._number_ids, dtype=bool)
+        in_members[members] = True
+        component = self._component[:self._size]
+        component[in_members[component]] = representative
+
+    def _reserve(self, size: int):
+        """
+        Doubles the capacity of the element buffers until they can hold size elements, and makes room for one more
+        component id, renumbering the alive components if at least half of the ids are unused.
+        """
+        capacity = len(self._data)
+        if size > capacity:
+            data = np.empty((2 * capacity, self.dim))
+            data[:self._size, :] = self._data[:self._size, :]
+            self._data = data
+
+            component = np.empty(2 * capacity, dtype=int)
+            component[:self._size] = self._component[:self._size]
+            self._component = component
+
+        capacity = len(self._alive)
+        if self._number_ids < capacity:
+            return
+
+        alive = np.flatnonzero(self._alive[:self._number_ids])
+        if 2 * len(alive) > capacity:
+            capacity *= 2
+
+        self._reach = _select(self._reach, alive, capacity)
+        self._reached_by = _select(self._reached_by, alive, capacity)
+        self._has_ancestor = np.append(self._has_ancestor[alive], np.zeros(capacity - len(alive), dtype=bool))
+        self._alive = np.append(np.ones(len(alive), dtype=bool), np.zeros(capacity - len(alive), dtype=bool))
+
+        new_id = np.zeros(self._number_ids, dtype=int)
+        new_id[alive] = np.arange(len(alive))
+        self._component[:self._size] = new_id[self._component[:self._size]]
+        self._number_ids = len(alive)
+
+
+def _zero_rows(capacity: int):
+    """
+    Packed rows of capacity bits for capacity ids.
+    """
+    return np.zeros((capacity, -(-capacity // WORD_SIZE)), dtype=np.uint64)
+
+
+def _set_bits(number_words: int, indices: np.ndarray):
+    """
+    Packed row with the bits indices set.
+    """
+    row = np.zeros(number_words, dtype=np.uint64)
+    np.bitwise_or.at(row, indices // WORD_SIZE,
+                     np.left_shift(np.uint64(1), (WORD_SIZE - 1 - indices % WORD_SIZE).astype(np.uint64)))
+    return row
+
+
+def _or_rows(words: np.ndarray, rows: np.ndarray):
+    """
+    OR of the packed rows rows.
+    """
+    if len(rows) == 0:
+        return np.zeros(words.shape[1], dtype=np.uint64)
+    return np.bitwise_or.reduce(words[rows, :], axis=0)
+
+
+def _add_bit(words: np.ndarray, rows: np.ndarray, j: int):
+    """
+    Sets bit j of the packed rows rows in place.
+    """
+    words[rows, j // WORD_SIZE] |= np.uint64(1 << (WORD_SIZE - 1 - j % WORD_SIZE))
+
+
+def _select(words: np.ndarray, ids: np.ndarray, capacity: int):
+    """
+    Keeps the rows and columns ids of packed rows, renumbered in order, in new rows of capacity bits.
+    """
+    selected = _zero_rows(capacity)
+    for start in range(0, len(ids), 1024):
+        rows = ids[start:start + 1024]
+        block = unpack_rows(words[rows, :], words.shape[1] * WORD_SIZE)[:, ids]
+        padded = np.zeros((len(rows), capacity), dtype=bool)
+        padded[:, :len(ids)] = block
+        selected[start:start + len(rows), :] = pack_rows(padded)
+    return selected
@@ -1,6 +1,70 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import *
 
 import numpy as np
+import pandas as pd
+
+from . import backend
+
+
+ACCEPTED = 'accepted'
+REJECTED_FIRST_OBJECTIVE = 'rejected_first_objective'
+REJECTED_DOMINATED = 'rejected_dominated'
+
+
+class DigestStats:
+    """DigestStats which records the outcome of every digest of an EBOStreamTracker: whether the applicant was
+    rejected on the first objective, rejected because a candidate dominates it or accepted, how many candidates it
+    evicted, the candidate set size afterwards and the wall time of the digest.
+    """
+
+    def __init__(self):
+        self.outcomes = []
+        self.evictions = []
+        self.sizes = []
+        self.wall_times = []
+
+    def record(self, outcome: str, evictions: int, size: int, wall_time: float):
+        """
+        Records one digest.
+        :param outcome: ACCEPTED, REJECTED_FIRST_OBJECTIVE or REJECTED_DOMINATED
+        :param evictions: number of candidates evicted by the applicant
+        :param size: candidate set size after the digest
+        :param wall_time: seconds spent in the digest
+        :return:
+        """
+        self.outcomes.append(outcome)
+        self.evictions.append(evictions)
+        self.sizes.append(size)
+        self.wall_times.append(wall_time)
+
+    def size_histogram(self):
+        """
+        Number of digests after which the candidate set had size k, for k = 0, ..., max size.
+        """
+        return np.bincount(np.asarray(self.sizes, dtype=int))
+
+    def as_dict(self):
+        """
+        Summary of all recorded digests.
+        """
+        return {
+            'digests': len(self.outcomes),
+            'accepted': self.outcomes.count(ACCEPTED),
+            'rejected_first_objective': self.outcomes.count(REJECTED_FIRST_OBJECTIVE),
+            'rejected_dominated': self.outcomes.count(REJECTED_DOMINATED),
+            'evictions': int(np.sum(self.evictions)),
+            'size_histogram': self.size_histogram().tolist(),
+            'wall_time': float(np.sum(self.wall_times)),
+        }
+
+    def to_dataframe(self):
+        """
+        One row per recorded digest.
+        """
+        return pd.DataFrame({'outcome': self.outcomes, 'evictions': self.evictions, 'size': self.sizes,
+                             'wall_time': self.wall_times})
 
 
 class EBOStreamTracker:
@@ -10,14 +74,34 @@ class EBOStreamTracker:
     of the a lexicographic semiorder at hand.
     """
 
-    def __init__(self, slack: List[float]):
+    def __init__(self, slack: List[float], initial_capacity: int = 16, stats: DigestStats = None):
         self.slack = slack
-        self.candidates = None
         self.discarded = None
         self.dim = len(slack)
         self.number_comparisons = 0
         self.max_candidates = 1
 
+        # optional record of every digest, nothing is measured if None
+        self.stats = stats
+
+        # candidates are stored sorted by the first objective in the first _size rows of a buffer whose capacity
+        # doubles when it is full, _arrival holds the arrival stamp of each candidate
+        self._buffer = None
+        self._arrival = None
+        self._size = 0
+        self._number_arrivals = 0
+        self._initial_capacity = initial_capacity
+
+    @property
+    def candidates(self):
+        """
+        Current candidate set, sorted by the first objective, as a view into the internal buffer or None if no element
+        has been digested yet. The view is only valid until the next digest.
+        """
+        if self._size == 0:
+            return None
+        return self._buffer[:self._size, :]
+
     def digest(self, x: np.ndarray):
         """
         Updates the EBO Tracker when a new input element is available
@@ -25,37 +109,314 @@ class EBOStreamTracker:
         :return:
         """
         x = np.reshape(x, (1, self.dim))
+        if self.stats is not None:
+            self._digest_recorded(x[0])
+            return
+
         # if candidate set is empty add x
-        if self.candidates is None:
-            self.candidates = x
+        if self._size == 0:
+            self._initialize(x[0])
             return
+
+        self._digest_point(x[0])
+
+    def digest_many(self, block: np.ndarray):
+        """
+        Updates the EBO Tracker with a block of input elements, equivalent to calling digest for each row in order.
+        Under the numba backend the whole block is digested by a compiled loop.
+        :param block: applicant points, one per row
+        :return:
+        """
+        block = np.reshape(block, (-1, self.dim))
+        if len(block) == 0:
+            return
+
+        if self.stats is not None:
+            for k in range(len(block)):
+                self._digest_recorded(block[k, :])
+            return
+
+        if backend.get_backend() == 'numba':
+            self._digest_compiled(block)
+            return
+
+        start = 0
+        if self._size == 0:
+            self._initialize(block[0, :])
+            start = 1
+
+        for k in range(start, len(block)):
+            self._digest_point(block[k, :])
+
+    def _digest_compiled(self, block: np.ndarray):
+        """
+        Digests a block with the compiled _digest_block. The buffer is grown and promoted beforehand, so that every
+        point of the block fits into it.
+        :param block: applicant points, one per row
+        :return:
+        """
+        if self._buffer is None:
+            self._initialize(block[0, :])
+            block = block[1:, :]
+
+        capacity = max(len(self._buffer), self._size + len(block))
+        dtype = np.promote_types(self._buffer.dtype, block.dtype)
+        if capacity > len(self._buffer) or dtype != self._buffer.dtype:
+            buffer = np.empty((max(capacity, 2 * len(self._buffer)), self.dim), dtype=dtype)
+            buffer[:self._size, :] = self._buffer[:self._size, :]
+            arrival = np.empty(len(buffer), dtype=int)
+            arrival[:self._size] = self._arrival[:self._size]
+            self._buffer = buffer
+            self._arrival = arrival
+
+        # the threshold in the dtype of the buffer, so the first objective is compared as in _digest_point
+        digest_block = backend.compiled(_digest_block)
+        self._size, self._number_arrivals, number_comparisons, self.max_candidates = digest_block(
+            backend.compiled(_scan_candidates), self._buffer, self._arrival, self._size, self._number_arrivals,
+            block, self._buffer.dtype.type(self.slack[0]), self.max_candidates)
+        self.number_comparisons += number_comparisons
+
+    def _digest_recorded(self, current: np.ndarray):
+        """
+        Digests an applicant point and records the outcome in stats.
+        :param current: applicant point
+        :return:
+        """
+        start = time.perf_counter()
+        if self._size == 0:
+            self._initialize(current)
+            outcome, evictions = ACCEPTED, 0
         else:
+            outcome, evictions = self._digest_point(current)
+        self.stats.record(outcome, evictions, self._size, time.perf_counter() - start)
+
+    def _digest_point(self, current: np.ndarray):
+        """
+        Compares an applicant point with the candidates, which are kept sorted by the first objective.
+
+        The applicant is discarded on the first objective iff the candidate with the smallest first objective discards
+        it. Otherwise, binary search splits the candidates into those which can dominate the applicant (first objective
+        not larger), those which can be dominated by it (first objective larger but within the threshold) and those
+        discarded on the first objective. Only the first two groups are compared point-to-point. The candidates which
+        can dominate the applicant are counted in order of arrival up to the first one which does.
+        :param current: applicant point
+        :return: outcome of the digest and the number of evicted candidates
+        """
+        candidates = self._buffer[:self._size, :]
+        first = candidates[:, 0]
+
+        # the candidate with the smallest first objective discards the applicant on the first objective
+        if current[0] > first[0] + self.slack[0]:
+            self.number_comparisons += 1
+            return REJECTED_FIRST_OBJECTIVE, 0
+
+        middle = np.searchsorted(first, current[0], side='right')
+        upper = np.searchsorted(first, current[0] + self.slack[0], side='right')
 
-            current = x[0]
-            index_filter = np.ones(len(self.candidates), dtype=bool)
-            for j in range(len(self.candidates)):
+        # candidates which may dominate the applicant
+        rejected = np.all(current >= candidates[:middle, :], axis=1)
+        if rejected.any():
+            arrival = self._arrival[:middle]
+            self.number_comparisons += int(np.count_nonzero(arrival <= arrival[rejected].min()))
+            return REJECTED_DOMINATED, 0
 
-                self.number_comparisons += 1
+        # candidates within the threshold which may be dominated by the applicant, all above upper are discarded
+        keep = middle + np.flatnonzero(np.invert(np.all(candidates[middle:upper, :] > current, axis=1)))
 
-                y = self.candidates[j, :]
+        self.number_comparisons += int(upper)
 
-                if current[0] > y[0] + self.slack[0]:
-                    return
+        size = self._size
+        self._insert(middle, current, keep)
 
-                if y[0] > current[0] + self.slack[0]:
-                    index_filter[j] = False
-                    continue
+        self.max_candidates = self.max_candidates if self._size < self.max_candidates else self._size
 
-                if all(np.greater_equal(current, y)):
-                    return
+        return ACCEPTED, size + 1 - self._size
 
-                if all(np.greater(y, current)):
-                    index_filter[j] = False
-                    continue
+    def _insert(self, position: int, x: np.ndarray, keep: np.ndarray):
+        """
+        Replaces all candidates from position on by x followed by the candidates with indices keep, doubling the buffer
+        capacity if necessary. The buffer is promoted to the dtype of x if x does not fit into it, e.g. a float64 point
+        after float32 points, so no applicant is rounded.
+        :param position: insert position of x
+        :param x: new candidate
+        :param keep: sorted indices, all larger or equal to position, of the candidates remaining after x
+        :return:
+        """
+        size = position + 1 + len(keep)
+        tail = self._buffer[keep, :]
+        tail_arrival = self._arrival[keep]
+        dtype = np.promote_types(self._buffer.dtype, x.dtype)
+
+        if size > len(self._buffer) or dtype != self._buffer.dtype:
+            capacity = max(2 * len(self._buffer), size) if size > len(self._buffer) else len(self._buffer)
+            buffer = np.empty((capacity, self.dim), dtype=dtype)
+            buffer[:position, :] = self._buffer[:position, :]
+            arrival = np.empty(capacity, dtype=int)
+            arrival[:position] = self._arrival[:position]
+            self._buffer = buffer
+            self._arrival = arrival
+
+        self._buffer[position, :] = x
+        self._buffer[position + 1:size, :] = tail
+        self._arrival[position] = self._number_arrivals
+        self._arrival[position + 1:size] = tail_arrival
+        self._number_arrivals += 1
+        self._size = size
+
+    def _initialize(self, x: np.ndarray):
+        """
+        Starts the candidate set with x, allocating the buffer on first use.
+        :param x: first candidate
+        :return:
+        """
+        dtype = np.promote_types(np.asarray(x).dtype, np.float32)
+        if self._buffer is None or dtype != self._buffer.dtype:
+            self._buffer = np.empty((self._initial_capacity, self.dim), dtype=dtype)
+            self._arrival = np.empty(self._initial_capacity, dtype=int)
+
+        self._buffer[0, :] = x
+        self._arrival[0] = self._number_arrivals
+        self._number_arrivals += 1
+        self._size = 1
+
+
+def _digest_block(scan: Callable, buffer: np.ndarray, arrival: np.ndarray, size: int, number_arrivals: int,
+                  block: np.ndarray, slack_0: float, max_candidates: int):
+    """
+    Scalar version of EBOStreamTracker.digest_many, compiled by the numba backend. The buffer must have room for all
+    points of the block.
+    :param scan: _scan_candidates, compiled alike
+    :param buffer: candidate buffer, the first size rows sorted by the first objective
+    :param arrival: arrival stamps of the candidates
+    :param size: number of candidates
+    :param number_arrivals: number of accepted points so far
+    :param block: applicant points, one per row
+    :param slack_0: threshold of the first objective
+    :param max_candidates: largest candidate set size so far
+    :return: size, number of arrivals, number of comparisons of the block and the largest candidate set size
+    """
+    number_comparisons = 0
+
+    for b in range(len(block)):
+        current = block[b, :]
+
+        if size == 0:
+            buffer[0, :] = current
+            arrival[0] = number_arrivals
+            number_arrivals += 1
+            size = 1
+            continue
+
+        # the candidate with the smallest first objective discards the applicant on the first objective
+        if current[0] > buffer[0, 0] + slack_0:
+            number_comparisons += 1
+            continue
+
+        first = buffer[:size, 0]
+        middle = np.searchsorted(first, current[0], side='right')
+        upper = np.searchsorted(first, current[0] + slack_0, side='right')
+
+        count, keep = scan(buffer[:size, :], arrival[:size], current, middle, upper)
+        if count >= 0:
+            number_comparisons += count
+            continue
+        number_comparisons += upper
+
+        # replace all candidates from middle on by the applicant followed by the kept ones
+        tail = buffer[keep, :]
+        tail_arrival = arrival[keep]
+        size = middle + 1 + len(keep)
+        buffer[middle, :] = current
+        buffer[middle + 1:size, :] = tail
+        arrival[middle] = number_arrivals
+        arrival[middle + 1:size] = tail_arrival
+        number_arrivals += 1
+        max_candidates = max(max_candidates, size)
+
+    return size, number_arrivals, number_comparisons, max_candidates
+
+
+def _scan_candidates(candidates: np.ndarray, arrival: np.ndarray, current: np.ndarray, middle: int, upper: int):
+    """
+    Scalar version of the point-to-point comparisons of EBOStreamTracker._digest_point, called by _digest_block.
+    :param candidates: candidates sorted by the first objective
+    :param arrival: arrival stamps of the candidates
+    :param current: applicant point
+    :param middle: number of candidates which may dominate the applicant
+    :param upper: number of candidates within the threshold on the first objective
+    :return: number of comparisons if the applicant is rejected, else -1, and the indices of the candidates to keep
+    """
+    dim = candidates.shape[1]
+
+    # the first candidate in order of arrival which dominates the applicant
+    rejecter = -1
+    for j in range(middle):
+        dominates = True
+        for i in range(dim):
+            if not current[i] >= candidates[j, i]:
+                dominates = False
+                break
+        if dominates and (rejecter < 0 or arrival[j] < arrival[rejecter]):
+            rejecter = j
+
+    keep = np.empty(upper - middle, dtype=np.int64)
+
+    if rejecter >= 0:
+        count = 0
+        for j in range(middle):
+            if arrival[j] <= arrival[rejecter]:
+                count += 1
+        return count, keep[:0]
 
-            self.candidates = np.vstack((self.candidates[index_filter, :], x))
+    number_keep = 0
+    for j in range(middle, upper):
+        dominated = True
+        for i in range(dim):
+            if not candidates[j, i] > current[i]:
+                dominated = False
+                break
+        if not dominated:
+            keep[number_keep] = j
+            number_keep += 1
 
-        self.max_candidates = self.max_candidates if len(self.candidates) < self.max_candidates else len(self.candidates)
+    return -1, keep[:number_keep]
+
+
+def sharded_ebo(data_set: np.ndarray, slack: List[float], number_shards: int, max_workers: int = None):
+    """
+    Runs the EBO procedure with one EBOStreamTracker per shard on a pool of worker processes. An element discarded by
+    a shard tracker is discarded by a tracker on any superset of the shard as well, so the candidates of X are among
+    the concatenated shard candidates. A final tracker over those gives the same decision as ebo on X.
+    :param data_set: input set X, split into number_shards contiguous shards
+    :param slack: threshold parameters
+    :param number_shards: number of shards
+    :param max_workers: number of worker processes, all shards run in the current process if 1
+    :return: decision, list of the comparison counts of each shard and the comparison count of the merge pass
+    """
+    shards = [shard for shard in np.array_split(data_set, number_shards) if len(shard) > 0]
+
+    if max_workers == 1:
+        results = [_track_shard(shard, slack) for shard in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_track_shard, shards, [slack] * len(shards)))
+
+    merge_tracker = EBOStreamTracker(slack)
+    for candidates, _ in results:
+        merge_tracker.digest_many(candidates)
+
+    shard_comparisons = [number_comparisons for _, number_comparisons in results]
+    return ebo(merge_tracker.candidates, slack), shard_comparisons, merge_tracker.number_comparisons
+
+
+def _track_shard(shard: np.ndarray, slack: List[float]):
+    """
+    Digests one shard.
+    :return: candidates of the shard and the number of comparisons
+    """
+    tracker = EBOStreamTracker(slack)
+    tracker.digest_many(shard)
+    return tracker.candidates.copy(), tracker.number_comparisons
 
 
 def ebo(data_set: np.ndarray, sigma: List[float]):
@@ -85,4 +446,47 @@ def ebo(data_set: np.ndarray, sigma: List[float]):
         sort = decision[:, i] > min_value
         decision = decision[np.invert(sort), :]
 
-    return decision[0, :]
\ No newline at end of file
+    return decision[0, :]
+
+
+def ebo_batch(data_sets: np.ndarray, sigmas: np.ndarray):
+    """
+    Selects the EBO decision for many data sets and many threshold vectors at once. The survivor sets of all
+    combinations are kept as boolean masks over the elements, so the only Python loop runs over the objectives.
+
+    :param data_sets: input sets X, array of shape (n, dim) or (number_sets, n, dim)
+    :param sigmas: threshold parameters, array of shape (dim,) or (number_sigmas, dim)
+    :return: decisions of shape (number_sets, number_sigmas, dim), without the axes not present in the inputs
+    """
+    data_sets = np.asarray(data_sets)
+    sigmas = np.asarray(sigmas, dtype=float)
+
+    single_set = data_sets.ndim == 2
+    single_sigma = sigmas.ndim == 1
+    data_sets = np.reshape(data_sets, (-1,) + data_sets.shape[-2:])
+    sigmas = np.reshape(sigmas, (-1, sigmas.shape[-1]))
+    dim = sigmas.shape[1]
+
+    # values[b, 0, j, i] is objective i of element j in set b, survivors[b, s, j] marks the survivors for sigma s
+    values = data_sets[:, np.newaxis, :, :]
+    survivors = np.ones((len(data_sets), len(sigmas), data_sets.shape[1]), dtype=bool)
+
+    # Survivor set method on X
+    for i in range(dim):
+        min_value = np.where(survivors, values[..., i], np.inf).min(axis=2)
+        survivors &= values[..., i] <= (min_value + sigmas[np.newaxis, :, i])[..., np.newaxis]
+
+    # lexicographic selection on survivor set
+    for i in range(dim):
+        min_value = np.where(survivors, values[..., i], np.inf).min(axis=2)
+        survivors &= np.invert(values[..., i] > min_value[..., np.newaxis])
+
+    first = np.argmax(survivors, axis=2)
+    decisions = data_sets[np.arange(len(data_sets))[:, np.newaxis], first, :]
+
+    if single_sigma:
+        decisions = decisions[:, 0, :]
+    if single_set:
+        decisions = decisions[0]
+
+    return decisions
@@ -0,0 +1,66 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import *
+
+import numpy as np
+
+
+def run_experiment(trial: Callable, cells: List[Any], executions: int, seed: int = 0, max_workers: int = None,
+                   chunk_size: int = 100):
+    """
+    Runs independent random trials for every cell of a parameter grid on a pool of worker processes.
+
+    Each execution of a cell gets its own generator seeded with (seed, cell index, execution), so the results do not
+    depend on the number of workers or on the order in which the work is scheduled. The trial has to be a module level
+    function (it is pickled) taking the cell and a np.random.RandomState and returning one number or a tuple of numbers.
+    :param trial: function trial(cell, random_state) returning the statistics of one execution
+    :param cells: parameters of each cell, e.g. (n, dim, sigma)
+    :param executions: number of executions per cell
+    :param seed: base seed
+    :param max_workers: number of worker processes, all cells run in the current process if 1
+    :param chunk_size: number of executions of a cell handed to a worker at once
+    :return: for each cell a tuple (min, mean, max) of every statistic, e.g. (min_0, mean_0, max_0, min_1, ...)
+    """
+    tasks = [(cell_index, start, min(start + chunk_size, executions))
+             for cell_index in range(len(cells)) for start in range(0, executions, chunk_size)]
+
+    outcomes = [[] for _ in cells]
+
+    if max_workers == 1:
+        for cell_index, start, stop in tasks:
+            outcomes[cell_index].extend(_run_chunk(trial, cells[cell_index], cell_index, start, stop, seed))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(cell_index,
+                        executor.submit(_run_chunk, trial, cells[cell_index], cell_index, start, stop, seed))
+                       for cell_index, start, stop in tasks]
+            for cell_index, future in futures:
+                outcomes[cell_index].extend(future.result())
+
+    return [_summarize(cell_outcomes) for cell_outcomes in outcomes]
+
+
+def _run_chunk(trial: Callable, cell: Any, cell_index: int, start: int, stop: int, seed: int):
+    """
+    Runs the executions start, ..., stop - 1 of one cell.
+    :return: list of statistics tuples
+    """
+    results = []
+    for execution in range(start, stop):
+        random_state = np.random.RandomState([seed, cell_index, execution])
+        results.append(np.atleast_1d(trial(cell, random_state)))
+
+    return results
+
+
+def _summarize(cell_outcomes: List[np.ndarray]):
+    """
+    Merges the statistics of all executions of a cell.
+    :return: tuple (min_0, mean_0, max_0, min_1, mean_1, max_1, ...)
+    """
+    values = np.array(cell_outcomes, dtype=float)
+
+    summary = []
+    for k in range(values.shape[1]):
+        summary.extend([np.min(values[:, k]), np.mean(values[:, k]), np.max(values[:, k])])
+
+    return tuple(summary)
@@ -14,37 +14,121 @@ def set_subtraction(set_a: np.ndarray, set_b: np.ndarray):
     if set_b is None:
         return set_a
 
-    index_filter = np.zeros(len(set_a), dtype=bool)
-    for i in range(len(set_a)):
-        current = set_a[i, :]
-        any_equals = False
-        for j in range(len(set_b)):
-            to_compare = set_b[j, :]
+    different_entries = set_a[set_subtraction_index(set_a, set_b), :]
 
-            if all(current == to_compare):
-                any_equals = True
+    return different_entries
+
+
+def set_subtraction_index(set_a: np.ndarray, set_b: np.ndarray):
+    """
+    Computes which rows of set_a are not contained in set_b by comparing the rows as raw bytes with np.isin, which
+    sorts them, in O((|A| + |B|) log(|A| + |B|)) instead of comparing all pairs of rows.
+    :param set_a: superset
+    :param set_b: subset
+    :return: boolean index filter of the rows of set_a - set_b
+    """
+    if set_b is None or len(set_b) == 0:
+        return np.ones(len(set_a), dtype=bool)
 
-        if not any_equals:
-            index_filter[i] = True
+    set_b = np.reshape(set_b, (-1, set_a.shape[1]))
+    dtype = np.promote_types(set_a.dtype, set_b.dtype)
 
-    different_entries = set_a[index_filter, :]
+    rows_a = _row_view(set_a.astype(dtype))
+    rows_b = _row_view(set_b.astype(dtype))
 
-    return different_entries
+    index_filter = np.invert(np.isin(rows_a, rows_b))
 
+    # rows with NaN entries never compare equal
+    if np.issubdtype(dtype, np.floating):
+        index_filter |= np.isnan(set_a).any(axis=1)
 
-def create_random_points(dim: int, num: int):
+    return index_filter
+
+
+def _row_view(data_set: np.ndarray):
+    """
+    Views each row of a 2D array as a single opaque element, so rows can be sorted and compared as a whole.
+    """
+    # adding zero maps -0.0 to 0.0, which compare equal but differ in their bytes
+    if np.issubdtype(data_set.dtype, np.floating):
+        data_set = data_set + 0.0
+    data_set = np.ascontiguousarray(data_set)
+    return data_set.view(np.dtype((np.void, data_set.dtype.itemsize * data_set.shape[1]))).ravel()
+
+
+def create_random_points(dim: int, num: int, random_state: np.random.RandomState = None):
     """
     Generates num random data points between 0 and 1
+    :param random_state: random number generator, the global numpy generator is used if None
     """
-    data_values = np.random.rand(num, dim)
+    if random_state is None:
+        random_state = np.random
+    data_values = random_state.rand(num, dim)
     return data_values
 
 
-def get_data_from_csv(file_name: str):
+def get_data_from_csv(file_name: str, directory: str = 'resources', dtype: np.dtype = None):
     """
     Retrieve Data from csv file and return dataframe
+    :param file_name: name of the csv file
+    :param directory: directory of the file, relative to the working directory; None if file_name is a full path
+    :param dtype: data type of the values, e.g. np.float32
     :return: np.array of data values
     """
-    file_name = os.path.join('resources', file_name)
-    df = pd.read_csv(file_name)
+    if directory is not None:
+        file_name = os.path.join(directory, file_name)
+    df = pd.read_csv(file_name, dtype=dtype)
     return df.values
+
+
+def convert_csv_to_npy(csv_path: str, npy_path: str, dtype: np.dtype = np.float32, chunk_size: int = 100000):
+    """
+    Converts a csv file with a header row into a binary .npy file, reading chunk_size rows at a time. The file is
+    written through a memory map, so neither the csv nor the array has to fit in memory.
+    :param csv_path: path of the csv file
+    :param npy_path: path of the .npy file to create
+    :param dtype: data type of the stored values
+    :param chunk_size: number of rows read at once
+    :return: shape of the stored array
+    """
+    # first pass to find the shape of the array
+    rows = 0
+    columns = 0
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
+        rows += len(chunk)
+        columns = chunk.shape[1]
+
+    data_values = np.lib.format.open_memmap(npy_path, mode='w+', dtype=dtype, shape=(rows, columns))
+
+    start = 0
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_size, dtype=dtype):
+        data_values[start:start + len(chunk), :] = chunk.values
+        start += len(chunk)
+
+    data_values.flush()
+    shape = data_values.shape
+    del data_values
+
+    return shape
+
+
+def load_npy(npy_path: str, mmap: bool = True):
+    """
+    Opens a .npy file, as read-only memory map by default, so rows are only read from disk when they are accessed.
+    :param npy_path: path of the .npy file
+    :param mmap: memory map the file instead of reading it
+    :return: np.array (or np.memmap) of data values
+    """
+    return np.load(npy_path, mmap_mode='r' if mmap else None)
+
+
+def data_chunks(data_values: np.ndarray, chunk_size: int):
+    """
+    Hands out consecutive blocks of rows as views, e.g. of a memory mapped array, without copying them. The blocks can
+    be fed to EBOStreamTracker.digest_many or to the minimals functions.
+    :param data_values: data values
+    :param chunk_size: number of rows per block
+    :return: generator of blocks
+    """
+    for start in range(0, len(data_values), chunk_size):
+        yield data_values[start:start + chunk_size]
@@ -2,6 +2,9 @@ from typing import *
 
 import numpy as np
 
+from .backend import kernel
+from .packed import PackedRelation, WORD_SIZE, pack_rows, unpack_rows
+
 
 def lex_semiorder_comparison(x: np.ndarray, y: np.ndarray, sigma: List[float]):
     """
@@ -25,29 +28,71 @@ def lex_semiorder_comparison(x: np.ndarray, y: np.ndarray, sigma: List[float]):
     return True
 
 
-def adjacency_matrix(data_set: np.ndarray, sigma: List[float]):
+def adjacency_matrix(data_set: np.ndarray, sigma: List[float], chunk_size: int = 1024, packed: bool = False):
     """
     Computes adjacency matrix (or matrix representation) for R on X.
+
+    The relation is evaluated for a block of rows against all elements at once, one objective at a time. Every pair
+    keeps track of whether it has already been decided by a previous objective, which reproduces the early exit of
+    lex_semiorder_comparison. Rows are processed in chunks to bound the size of the temporary arrays.
     :param data_set: in put set X
     :param sigma: threshold parameters
+    :param chunk_size: number of rows evaluated at once
+    :param packed: return a bit-packed PackedRelation instead of a boolean matrix
     :return: Adjacency matrix M of <X,R>
     """
     n = len(data_set)
 
+    if packed:
+        a_matrix = PackedRelation.zeros(n)
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            a_matrix.set_rows(start, _adjacency_rows(data_set, sigma, start, stop))
+        return a_matrix
+
     # initialize zero matrix of dim n x n
     a_matrix = np.zeros((n, n), dtype=bool)
 
-    for i in range(n):
-        x_i = data_set[i, :]
-        for j in range(n):
-            x_j = data_set[j, :]
-            # compare elements and set entry
-            if lex_semiorder_comparison(x_i, x_j, sigma):
-                a_matrix[i, j] = True
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        a_matrix[start:stop, :] = _adjacency_rows(data_set, sigma, start, stop)
 
     return a_matrix
 
 
+def _adjacency_rows(data_set: np.ndarray, sigma: List[float], start: int, stop: int):
+    """
+    Computes the rows start, ..., stop - 1 of the adjacency matrix for R on X.
+    :param data_set: input set X
+    :param sigma: threshold parameters
+    :param start: first row
+    :param stop: last row (exclusive)
+    :return: boolean block of shape (stop - start, n)
+    """
+    n = len(data_set)
+    dim = len(sigma)
+
+    # pairs are in relation unless an objective decides against them
+    rows = np.ones((stop - start, n), dtype=bool)
+    undecided = np.ones((stop - start, n), dtype=bool)
+
+    for i in range(dim):
+        x_i = data_set[start:stop, i][:, np.newaxis]
+        y_i = data_set[:, i][np.newaxis, :]
+        # x strictly precedes y in dim i
+        precedes = x_i + sigma[i] < y_i
+        # y strictly precedes x in dim i
+        succeeds = y_i + sigma[i] < x_i
+
+        rows[undecided & succeeds] = False
+        undecided &= ~(precedes | succeeds)
+
+        if not undecided.any():
+            break
+
+    return rows
+
+
 def adj_matrix_strict(a_matrix: np.ndarray):
     """
     Computes adjacency matrix (or matrix representation) for P on X.
@@ -55,12 +100,16 @@ def adj_matrix_strict(a_matrix: np.ndarray):
     :param a_matrix: Adjacency matrix for R on X
     :return: Adjacency matrix M of <X,P>
     """
+    if isinstance(a_matrix, PackedRelation):
+        return a_matrix.and_not(a_matrix.transpose())
+
     transpose = np.transpose(a_matrix)
     dual = np.logical_not(transpose)
 
     return np.logical_and(a_matrix, dual)
 
 
+@kernel
 def warshall(a_strict_matrix: np.ndarray):
     """
     Computes transitive closure of R on X using Warshall algorithm.
@@ -88,6 +137,9 @@ def trans_closure(a_strict_matrix: np.ndarray):
     """
     n = len(a_strict_matrix)
 
+    if isinstance(a_strict_matrix, PackedRelation):
+        return _trans_closure_packed(a_strict_matrix)
+
     trans_hull = a_strict_matrix.copy()
 
     for k in range(n):
@@ -100,69 +152,554 @@ def trans_closure(a_strict_matrix: np.ndarray):
     return trans_hull
 
 
-def minimal_cycles(data_set: np.ndarray, sigma: List[float]):
+def _trans_closure_packed(a_strict_matrix: PackedRelation):
     """
-    Computes the minimal elements, e.g. bottom cycles, for the lexicographic semiorder on a set X.
-    :param data_set: input set X
-    :param sigma: threshold parameters
-    :return: minimal set
+    Computes transitive closure of a bit-packed relation using Warshall algorithm on whole rows: every row containing
+    k is joined with row k.
+    :param a_strict_matrix: PackedRelation of <X,P>
+    :return: PackedRelation of <X,P^T>
     """
-    n = len(data_set)
+    trans_hull = PackedRelation(a_strict_matrix.words.copy(), a_strict_matrix.n)
+
+    for k in range(trans_hull.n):
+        predecessors = np.flatnonzero(trans_hull.column(k))
+        if len(predecessors) != 0:
+            trans_hull.or_rows(predecessors, k)
+
+    return trans_hull
+
+
+def strongly_connected_components(a_strict_matrix: np.ndarray, chunk_size: int = 1024):
+    """
+    Computes the strongly connected components of <X,P> using an iterative version of Tarjan's algorithm.
+
+    The relation is walked in bits: the next successor of a vertex is the first set bit of its packed row and the
+    packed set of unvisited vertices, and the low link of a vertex is taken over its successors which are not yet
+    assigned to a component once all of them are visited. Only one row is handled at a time, so no successor lists
+    are built.
+    :param a_strict_matrix: Adjacency matrix M of <X,P> or PackedRelation
+    :param chunk_size: number of rows packed at once if the matrix is not packed
+    :return: component label of each element, labels are numbered in reverse topological order
+    """
+    n = len(a_strict_matrix)
+    words = _packed_words(a_strict_matrix, chunk_size)
+
+    # all bits of the valid columns set, the padding bits stay zero
+    unvisited = pack_rows(np.ones((1, n), dtype=bool))[0]
+    unassigned = unvisited.copy()
+
+    index = [-1] * n
+    low_link = np.zeros(n, dtype=int)
+    components = np.full(n, -1, dtype=int)
+
+    stack = []
+    counter = 0
+    number_components = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+
+        call_stack = [root]
+        index[root] = low_link[root] = counter
+        counter += 1
+        stack.append(root)
+        _clear_bit(unvisited, root)
+
+        while call_stack:
+            v = call_stack[-1]
+            w = _first_bit(words[v] & unvisited)
+            if w != -1:
+                index[w] = low_link[w] = counter
+                counter += 1
+                stack.append(w)
+                _clear_bit(unvisited, w)
+                call_stack.append(w)
+                continue
+
+            # all successors are visited, those without a component are on the stack
+            on_stack = words[v] & unassigned
+            if on_stack.any():
+                successors = np.flatnonzero(unpack_rows(on_stack[np.newaxis, :], n)[0])
+                low_link[v] = min(low_link[v], low_link[successors].min())
+            call_stack.pop()
+
+            # v is the root of a component, pop it from the stack
+            if low_link[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    _clear_bit(unassigned, w)
+                    components[w] = number_components
+                    if w == v:
+                        break
+                number_components += 1
+
+    return components
+
+
+def _packed_words(a_matrix: np.ndarray, chunk_size: int = 1024):
+    """
+    Returns the uint64 words of a relation, packing a boolean matrix chunk by chunk.
+    """
+    if isinstance(a_matrix, PackedRelation):
+        return a_matrix.words
+
+    n = len(a_matrix)
+    packed = PackedRelation.zeros(n)
+    for start in range(0, n, chunk_size):
+        packed.set_rows(start, a_matrix[start:start + chunk_size, :])
+    return packed.words
+
+
+def _row_blocks(a_matrix: np.ndarray, chunk_size: int = 1024):
+    """
+    Hands out consecutive blocks of rows of a relation as boolean arrays, unpacking a PackedRelation block by block.
+    :return: generator of (start, block)
+    """
+    n = len(a_matrix)
+    for start in range(0, n, chunk_size):
+        if isinstance(a_matrix, PackedRelation):
+            yield start, unpack_rows(a_matrix.words[start:start + chunk_size, :], n)
+        else:
+            yield start, a_matrix[start:start + chunk_size, :]
+
+
+def _first_bit(words: np.ndarray):
+    """
+    Position of the first set bit of a packed row, -1 if no bit is set.
+    """
+    nonzero = np.flatnonzero(words)
+    if len(nonzero) == 0:
+        return -1
+    k = nonzero[0]
+    return int(k) * WORD_SIZE + WORD_SIZE - int(words[k]).bit_length()
+
+
+def _clear_bit(words: np.ndarray, j: int):
+    """
+    Clears bit j of a packed row in place.
+    """
+    words[j // WORD_SIZE] &= ~np.uint64(1 << (WORD_SIZE - 1 - j % WORD_SIZE))
 
-    a_matrix = adjacency_matrix(data_set, sigma)
-    a_matrix_strict = adj_matrix_strict(a_matrix)
-    trans_hull = trans_closure(a_matrix_strict)
+
+def bottom_cycles_scc(a_strict_matrix: np.ndarray, components: np.ndarray = None, chunk_size: int = 1024):
+    """
+    Computes the bottom cycles of <X,P> from its strongly connected components. An element is minimal if its component
+    has no strict predecessor outside of the component. The relation is scanned in blocks of rows.
+    :param a_strict_matrix: Adjacency matrix M of <X,P> or PackedRelation
+    :param components: component labels from strongly_connected_components, computed if None
+    :param chunk_size: number of rows scanned at once
+    :return: boolean index filter of the minimal elements
+    """
+    if components is None:
+        components = strongly_connected_components(a_strict_matrix)
+
+    dominated = np.zeros(components.max() + 1 if len(components) else 0, dtype=bool)
+
+    for start, block in _row_blocks(a_strict_matrix, chunk_size):
+        crossing = block & (components[start:start + len(block), np.newaxis] != components[np.newaxis, :])
+        dominated[components[crossing.any(axis=0)]] = True
+
+    return np.invert(dominated[components])
+
+
+def bottom_cycles_reach(a_strict_matrix: np.ndarray, chunk_size: int = 1024):
+    """
+    Computes the bottom cycles of <X,P> by breadth-first searches on the packed rows of P and of its transpose, without
+    the strongly connected components of all elements.
+
+    The elements without strict predecessor are bottom cycles of their own and everything they reach is not minimal.
+    From any undecided element v the search climbs the condensation: if some ancestor of v is not reached by v, v and
+    all it reaches are not minimal and the search continues from that ancestor, else the ancestors of v together with
+    v form a bottom cycle. Every climb ends in a new bottom cycle, so the number of searches grows with the number of
+    bottom cycles and the depth of the condensation instead of with n, and each search step is a single OR over
+    packed rows.
+    :param a_strict_matrix: Adjacency matrix M of <X,P> or PackedRelation
+    :param chunk_size: number of rows handled at once
+    :return: boolean index filter of the minimal elements
+    """
+    n = len(a_strict_matrix)
+    words = _packed_words(a_strict_matrix, chunk_size)
+    words_transposed = PackedRelation(words, n).transpose().words
+
+    in_degree = np.zeros(n, dtype=int)
+    for _, block in _row_blocks(a_strict_matrix, chunk_size):
+        in_degree += block.sum(axis=0)
+
+    # elements without strict predecessor
+    index_filter = in_degree == 0
+    decided = index_filter | _reached(words, index_filter, n, chunk_size)
+
+    while not decided.all():
+        # climb from the undecided element with the fewest predecessors
+        v = np.flatnonzero(~decided)[np.argmin(in_degree[~decided])]
+        while True:
+            single = np.zeros(n, dtype=bool)
+            single[v] = True
+            descendants = _reached(words, single, n, chunk_size)
+            ancestors = _reached(words_transposed, single, n, chunk_size)
+            decided |= single | descendants
+
+            outside = ancestors & ~descendants
+            if not outside.any():
+                index_filter |= single | ancestors
+                break
+            v = np.flatnonzero(outside)[np.argmin(in_degree[outside])]
+
+    return index_filter
+
+
+def _reached(words: np.ndarray, sources: np.ndarray, n: int, chunk_size: int = 1024):
+    """
+    Breadth-first search on packed rows.
+    :param words: packed rows of a relation
+    :param sources: boolean index filter of the start elements
+    :param n: number of elements
+    :param chunk_size: number of rows combined at once
+    :return: boolean index filter of the elements reached in one or more steps
+    """
+    reached = np.zeros(words.shape[1], dtype=np.uint64)
+    frontier = np.flatnonzero(sources)
+
+    while len(frontier):
+        step = np.zeros_like(reached)
+        for start in range(0, len(frontier), chunk_size):
+            step |= np.bitwise_or.reduce(words[frontier[start:start + chunk_size], :], axis=0)
+        step &= ~reached
+        reached |= step
+        frontier = np.flatnonzero(unpack_rows(step[np.newaxis, :], n)[0])
+
+    return unpack_rows(reached[np.newaxis, :], n)[0]
+
+
+def bottom_cycles_closure(a_strict_matrix: np.ndarray, trans_hull: np.ndarray = None):
+    """
+    Computes the bottom cycles of <X,P> from the transitive closure P^T. Reference implementation for
+    bottom_cycles_scc.
+    :param a_strict_matrix: Adjacency matrix M of <X,P> or PackedRelation
+    :param trans_hull: transitive closure from trans_closure, computed if None
+    :return: boolean index filter of the minimal elements
+    """
+    if trans_hull is None:
+        trans_hull = trans_closure(a_strict_matrix)
     trans_hull_strict = adj_matrix_strict(trans_hull)
-    index_filter = np.ones(n, dtype=bool)
 
-    for i in range(n):
-        if trans_hull_strict[:, i].any():
-            index_filter[i] = False
+    return np.invert(trans_hull_strict.any(axis=0))
 
-    minimals = data_set[index_filter, :]
-    return minimals
 
+class ReachabilityIndex:
+    """ReachabilityIndex which answers queries x P^T y without the transitive closure of <X,P>. The strongly connected
+    components of <X,P> are condensed into a DAG and every component is labelled with the bitset of the components it
+    reaches, which needs k x k bits for k components instead of n x n booleans. x P^T y holds iff x and y lie in a
+    common cycle or the component of x reaches the component of y, and a query reads a single word of the labels.
+    """
 
-def minimal_diamond(data_set: np.ndarray, sigma: List[float]):
+    def __init__(self, a_strict_matrix: np.ndarray, components: np.ndarray = None, chunk_size: int = 1024):
+        if components is None:
+            components = strongly_connected_components(a_strict_matrix)
+
+        self.components = components
+        self.n = len(components)
+        number_components = components.max() + 1 if self.n else 0
+
+        # components with more than one element lie on a cycle of P, P itself is irreflexive
+        self.cyclic = np.bincount(components, minlength=number_components) > 1
+
+        # edges of the condensation, collected block by block: the columns of each block of rows are reduced to the
+        # components they belong to and the rows are merged into the labels of their components
+        self.labels = PackedRelation.zeros(number_components)
+        order = np.argsort(components, kind='stable')
+        bounds = np.searchsorted(components[order], np.arange(number_components))
+        for start, block in _row_blocks(a_strict_matrix, chunk_size):
+            reduced = np.logical_or.reduceat(block[:, order], bounds, axis=1)
+            np.bitwise_or.at(self.labels.words, components[start:start + len(block)], pack_rows(reduced))
+
+        # edges inside a component are covered by self.cyclic
+        index = np.arange(number_components)
+        self.labels.words[index, index // WORD_SIZE] &= np.invert(
+            np.left_shift(np.uint64(1), (WORD_SIZE - 1 - index % WORD_SIZE).astype(np.uint64)))
+
+        # components are numbered in reverse topological order, so the labels of all successors are complete when
+        # they are added to their predecessors
+        for c in range(number_components):
+            successors = np.flatnonzero(self.labels[c])
+            for first in range(0, len(successors), chunk_size):
+                self.labels.words[c, :] |= np.bitwise_or.reduce(
+                    self.labels.words[successors[first:first + chunk_size], :], axis=0)
+
+    def reaches(self, i, j):
+        """
+        Tests x_i P^T x_j. The indices are broadcast against each other, so many pairs can be queried at once.
+        :param i: index or indices of x
+        :param j: index or indices of y
+        :return: True where x_i P^T x_j
+        """
+        ci = self.components[i]
+        cj = self.components[j]
+        words = self.labels.words[ci, cj // WORD_SIZE]
+        shifts = (WORD_SIZE - 1 - cj % WORD_SIZE).astype(np.uint64)
+        reached = (np.right_shift(words, shifts) & np.uint64(1)).astype(bool)
+        return reached | ((ci == cj) & self.cyclic[ci])
+
+    def descendants(self, i: int):
+        """
+        Boolean index filter of the elements y with x_i P^T y.
+        """
+        return self.reaches(i, np.arange(self.n))
+
+    def minimal_index(self):
+        """
+        Boolean index filter of the minimal elements, e.g. bottom cycles, i.e. the elements of the components which no
+        other component reaches.
+        """
+        if self.n == 0:
+            return np.zeros(0, dtype=bool)
+        return np.invert(self.labels.any(axis=0))[self.components]
+
+
+def minimal_cycles(data_set: np.ndarray, sigma: List[float], method: str = 'scc', packed: bool = False):
     """
-    Computes the minimal elements, if they exist, for the lexicographic semiorder on a set X.
+    Computes the minimal elements, e.g. bottom cycles, for the lexicographic semiorder on a set X.
     :param data_set: input set X
     :param sigma: threshold parameters
+    :param method: 'scc' for the strongly connected components, 'reach' for the searches on packed rows, 'index' for
+    the reachability index or 'closure' for the transitive closure
+    :param packed: use bit-packed relations
     :return: minimal set
     """
-    n = len(data_set)
+    return SemiorderRelation(data_set, sigma, packed=packed).minimal_cycles(method)
 
-    a_matrix = adjacency_matrix(data_set, sigma)
-    index_filter = np.ones(n, dtype=bool)
 
-    for i in range(n):
-        if not a_matrix[i, :].all():
-            index_filter[i] = False
-
-    minimals = data_set[index_filter, :]
-    return minimals
+def minimal_diamond(data_set: np.ndarray, sigma: List[float], method: str = 'sweep', packed: bool = False):
+    """
+    Computes the minimal elements, if they exist, for the lexicographic semiorder on a set X.
+    :param data_set: input set X
+    :param sigma: threshold parameters
+    :param method: 'sweep' for the sort-and-sweep algorithm or 'matrix' for the adjacency matrix
+    :param packed: use bit-packed relations, only used by the 'matrix' method
+    :return: minimal set
+    """
+    return SemiorderRelation(data_set, sigma, packed=packed).minimal_diamond(method)
 
 
-def minimal_small(data_set: np.ndarray, sigma: List[float]):
+def minimal_small(data_set: np.ndarray, sigma: List[float], method: str = 'sweep', packed: bool = False):
     """
     Computes the least element, if it exists, for the lexicographic semiorder on a set X.
     :param data_set: input set X
     :param sigma: threshold parameters
+    :param method: 'sweep' for the sort-and-sweep algorithm or 'matrix' for the adjacency matrix
+    :param packed: use bit-packed relations, only used by the 'matrix' method
     :return: minimal set
     """
-    n = len(data_set)
+    return SemiorderRelation(data_set, sigma, packed=packed).minimal_small(method)
 
-    a_matrix = adjacency_matrix(data_set, sigma)
-    i = np.identity(n, dtype=bool)
 
-    a_matrix_strict = np.logical_or(adj_matrix_strict(a_matrix), i)
+class SemiorderRelation:
+    """SemiorderRelation of a lexicographic semiorder on a set X. The adjacency matrices of R and P, the transitive
+    closure and the strongly connected components are computed on first use and cached, so that several minimal set
+    queries on the same set and thresholds share the work.
+    """
 
-    index_filter = np.zeros(n, dtype=bool)
+    def __init__(self, data_set: np.ndarray, sigma: List[float], packed: bool = False, a_matrix: np.ndarray = None):
+        self.data_set = data_set
+        self.sigma = sigma
+        self.packed = packed
+        self.n = len(data_set)
+
+        # a precomputed adjacency matrix of R can be handed in, e.g. by a threshold sweep
+        self._a_matrix = a_matrix
+        self._a_matrix_strict = None
+        self._trans_hull = None
+        self._components = None
+        self._reachability = None
+
+    @property
+    def a_matrix(self):
+        """
+        Adjacency matrix M of <X,R>.
+        """
+        if self._a_matrix is None:
+            self._a_matrix = adjacency_matrix(self.data_set, self.sigma, packed=self.packed)
+        return self._a_matrix
+
+    @property
+    def a_matrix_strict(self):
+        """
+        Adjacency matrix M of <X,P>.
+        """
+        if self._a_matrix_strict is None:
+            self._a_matrix_strict = adj_matrix_strict(self.a_matrix)
+        return self._a_matrix_strict
+
+    @property
+    def trans_hull(self):
+        """
+        Adjacency matrix M^T of <X,P^T>.
+        """
+        if self._trans_hull is None:
+            self._trans_hull = trans_closure(self.a_matrix_strict)
+        return self._trans_hull
+
+    @property
+    def components(self):
+        """
+        Strongly connected component of each element in <X,P>.
+        """
+        if self._components is None:
+            self._components = strongly_connected_components(self.a_matrix_strict)
+        return self._components
+
+    @property
+    def reachability(self):
+        """
+        ReachabilityIndex of <X,P>, answering x P^T y queries without the transitive closure.
+        """
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex(self.a_matrix_strict, self.components)
+        return self._reachability
+
+    def cycle_members(self, i: int):
+        """
+        Indices of the elements lying on a common cycle with element i, including i.
+        """
+        return np.flatnonzero(self.components == self.components[i])
+
+    def minimal_cycles_index(self, method: str = 'scc'):
+        """
+        Boolean index filter of the minimal elements, e.g. bottom cycles.
+        :param method: 'scc' for the strongly connected components, 'reach' for the searches on packed rows, 'index'
+        for the reachability index or 'closure' for the transitive closure
+        """
+        if method == 'scc':
+            return bottom_cycles_scc(self.a_matrix_strict, self.components)
+        elif method == 'reach':
+            return bottom_cycles_reach(self.a_matrix_strict)
+        elif method == 'index':
+            return self.reachability.minimal_index()
+        elif method == 'closure':
+            return bottom_cycles_closure(self.a_matrix_strict, self.trans_hull)
+
+        raise ValueError(f'Unknown method {method}')
+
+    def minimal_diamond_index(self, method: str = 'sweep'):
+        """
+        Boolean index filter of the elements x with xRy for all y.
+        :param method: 'sweep' for the sort-and-sweep algorithm or 'matrix' for the adjacency matrix
+        """
+        if method == 'sweep':
+            return _sweep_minimals(self.data_set, self.sigma, strict=False)
+        elif method == 'matrix':
+            return self.a_matrix.all(axis=1)
+
+        raise ValueError(f'Unknown method {method}')
+
+    def minimal_small_index(self, method: str = 'sweep'):
+        """
+        Boolean index filter of the element x with xPy for all y != x.
+        :param method: 'sweep' for the sort-and-sweep algorithm or 'matrix' for the adjacency matrix
+        """
+        if method == 'sweep':
+            return _sweep_minimals(self.data_set, self.sigma, strict=True)
+        elif method == 'matrix':
+            i = PackedRelation.identity(self.n) if self.packed else np.identity(self.n, dtype=bool)
+            return (self.a_matrix_strict | i).all(axis=1)
+
+        raise ValueError(f'Unknown method {method}')
+
+    def minimal_cycles(self, method: str = 'scc'):
+        """
+        Computes the minimal elements, e.g. bottom cycles.
+        """
+        return self.data_set[self.minimal_cycles_index(method), :]
+
+    def minimal_diamond(self, method: str = 'sweep'):
+        """
+        Computes the minimal elements, if they exist.
+        """
+        return self.data_set[self.minimal_diamond_index(method), :]
+
+    def minimal_small(self, method: str = 'sweep'):
+        """
+        Computes the least element, if it exists.
+        """
+        return self.data_set[self.minimal_small_index(method), :]
+
+
+def _sweep_minimals(data_set: np.ndarray, sigma: List[float], strict: bool, block_size: int = 1 << 22):
+    """
+    Finds the elements x with xRy (or xPy for all y != x if strict) for all y in X without building the relation.
 
-    for i in range(n):
-        if a_matrix_strict[i, :].all():
-            index_filter[i] = True
+    The elements are sorted by the first objective. Only elements within sigma_0 of the smallest first objective can
+    satisfy the condition, and for each of them only the elements inside its sigma_0 window, found by binary search,
+    are left undecided by the first objective. The windows of a block of candidates are then pruned objective by
+    objective at once. For xPy the search stops at the first hit, since P is asymmetric and the least element is
+    unique.
 
-    minimals = data_set[index_filter, :]
-    return minimals
+    If sigma_0 spans the data, every element is a candidate with the whole set as window, and the sweep compares all
+    pairs in O(n^2) like the adjacency matrix, in blocks of at most block_size pairs.
+    :param data_set: input set X
+    :param sigma: threshold parameters
+    :param strict: require xPy instead of xRy for all y != x
+    :param block_size: number of pairs compared at once
+    :return: boolean index filter
+    """
+    n = len(data_set)
+    dim = len(sigma)
 
+    index_filter = np.zeros(n, dtype=bool)
+    if n == 0:
+        return index_filter
+
+    order = np.argsort(data_set[:, 0], kind='stable')
+    sorted_set = data_set[order, :]
+    first = sorted_set[:, 0]
+    # y_0 + sigma_0 is non-decreasing in y_0, hence sorted as well
+    first_shifted = first + sigma[0]
+
+    # every other element is strictly preceded by the element with the smallest first objective
+    number_candidates = np.searchsorted(first, first[0] + sigma[0], side='right')
+    # smallest second objective among the elements up to each position in the sorted order
+    prefix_min = np.minimum.accumulate(sorted_set[:, 1]) if dim > 1 else None
+
+    candidates = order[:number_candidates]
+    x_0 = first[:number_candidates]
+
+    # window of elements y with neither x_0 + sigma_0 < y_0 nor y_0 + sigma_0 < x_0
+    lowers = np.searchsorted(first_shifted, x_0, side='left')
+    uppers = np.searchsorted(first, x_0 + sigma[0], side='right')
+    feasible = lowers == 0
+    # the windows are prefixes of the sorted order, reject x if some y in its window strictly precedes it in dim 1
+    if dim > 1:
+        feasible &= np.invert(prefix_min[uppers - 1] + sigma[1] < sorted_set[:number_candidates, 1])
+
+    positions = np.flatnonzero(feasible)
+    # the windows of the feasible candidates are prefixes, growing with the position
+    window = uppers[positions[-1]] if len(positions) else 0
+    step = max(1, block_size // max(window, 1))
+
+    for start in range(0, len(positions), step):
+        block = positions[start:start + step]
+        length = uppers[block[-1]]
+        x = sorted_set[block, :]
+        y = sorted_set[:length, :]
+
+        undecided = np.arange(length)[np.newaxis, :] < uppers[block][:, np.newaxis]
+        in_relation = np.ones(len(block), dtype=bool)
+
+        for i in range(1, dim):
+            # some y strictly precedes x in dim i
+            in_relation &= np.invert((undecided & (y[np.newaxis, :, i] + sigma[i] < x[:, np.newaxis, i])).any(axis=1))
+            # drop all y strictly preceded by x in dim i
+            undecided &= np.invert(x[:, np.newaxis, i] + sigma[i] < y[np.newaxis, :, i])
+
+        # for xPy the only element left indifferent to x is x itself
+        if strict:
+            in_relation &= undecided.sum(axis=1) == 1
+
+        hits = block[in_relation]
+        if strict and len(hits):
+            index_filter[candidates[hits[0]]] = True
+            break
+        index_filter[candidates[hits]] = True
+
+    return index_filter
@@ -0,0 +1,146 @@
+from typing import *
+
+import numpy as np
+
+
+def strict_precedence(x: np.ndarray, y: np.ndarray, sigma: List[float]):
+    """
+    Vectorized strict lexicographic semiorder comparison xPy. x and y are broadcast against each other row-wise, so
+    either of them can be a single point or a set of points.
+    :param x: point(s) x
+    :param y: point(s) y
+    :param sigma: threshold parameters
+    :return: boolean array, True where x strictly precedes y
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    shape = np.broadcast(x[..., 0], y[..., 0]).shape
+
+    precedes = np.zeros(shape, dtype=bool)
+    undecided = np.ones(shape, dtype=bool)
+
+    for i in range(len(sigma)):
+        better = x[..., i] + sigma[i] < y[..., i]
+        worse = y[..., i] + sigma[i] < x[..., i]
+        precedes |= undecided & better
+        undecided &= np.invert(better | worse)
+
+    return precedes
+
+
+class ExactMinTracker:
+    """ExactMinTracker which keeps track of the minimal elements Min(X) of a stream of input elements, i.e. the elements
+    which are not strictly preceded by any other element. Since P is not transitive, discarded elements can still
+    discard future elements. It suffices to remember the Pareto front of all elements seen so far: whenever y P x, the
+    element of the front dominating y strictly precedes x as well.
+    """
+
+    def __init__(self, slack: List[float]):
+        self.slack = slack
+        self.dim = len(slack)
+        self.candidates = None
+        self.front = None
+
+    def discardable_exact(self, x: np.ndarray, y: np.ndarray, i: int):
+        """
+        Checks if y can be discarded because x strictly precedes it on the objectives 0, ..., i.
+        :param x: reference point
+        :param y: point to check
+        :param i: last objective taken into account
+        :return: True if y can be discarded
+        """
+        for j in range(i + 1):
+            # x strictly precedes y in dim j
+            if x[j] + self.slack[j] < y[j]:
+                return True
+            # y strictly precedes x in dim j
+            elif y[j] + self.slack[j] < x[j]:
+                return False
+
+        return False
+
+    def update_mintracker_exact(self, x: np.ndarray):
+        """
+        Updates the tracker when a new input element is available.
+        :param x: new input element
+        :return:
+        """
+        x = np.reshape(x, (1, self.dim)).astype(float)
+
+        if self.candidates is None:
+            self.candidates = x
+            self.front = x
+            return
+
+        # x is not minimal if an element of the front strictly precedes it
+        minimal = not strict_precedence(self.front, x, self.slack).any()
+
+        self._update_front(x)
+        self._update_candidates(x, minimal)
+
+    def _update_candidates(self, x: np.ndarray, minimal: bool):
+        """
+        Discards all candidates strictly preceded by x and adds x if it is minimal.
+        """
+        index_filter = np.invert(strict_precedence(x, self.candidates, self.slack))
+        if minimal:
+            self.candidates = np.vstack((self.candidates[index_filter, :], x))
+        else:
+            self.candidates = self.candidates[index_filter, :]
+
+    def _update_front(self, x: np.ndarray):
+        """
+        Adds x to the Pareto front unless it is dominated, removing all elements dominated by x.
+        """
+        if np.all(self.front <= x, axis=1).any():
+            return
+
+        index_filter = np.invert(np.all(x <= self.front, axis=1))
+        self.front = np.vstack((self.front[index_filter, :], x))
+
+
+class ApproximateMinTracker(ExactMinTracker):
+    """ApproximateMinTracker which keeps track of the minimal elements up to a tolerance epsilon. A new element within
+    epsilon of a candidate in every objective is merged into that candidate, and the Pareto front is replaced by an
+    epsilon-box front holding at most one element per box. Both sets therefore have bounded size for bounded inputs,
+    and the tracker runs with constant memory on unbounded streams.
+    """
+
+    def __init__(self, slack: List[float], epsilon: List[float]):
+        super().__init__(slack)
+        self.epsilon = np.asarray(epsilon, dtype=float)
+
+    def update_mintracker_approx(self, x: np.ndarray):
+        """
+        Updates the tracker when a new input element is available.
+        :param x: new input element
+        :return:
+        """
+        x = np.reshape(x, (1, self.dim)).astype(float)
+
+        if self.candidates is None:
+            self.candidates = x
+            self.front = x
+            return
+
+        # merge near-duplicates of a candidate
+        if np.all(np.abs(self.candidates - x) <= self.epsilon, axis=1).any():
+            return
+
+        minimal = not strict_precedence(self.front, x, self.slack).any()
+
+        self._update_front(x)
+        self._update_candidates(x, minimal)
+
+    def _update_front(self, x: np.ndarray):
+        """
+        Adds x to the epsilon-box front unless its box is weakly dominated, removing all elements in dominated boxes.
+        """
+        box = np.floor(x / self.epsilon)
+        front_boxes = np.floor(self.front / self.epsilon)
+
+        if np.all(front_boxes <= box, axis=1).any():
+            return
+
+        index_filter = np.invert(np.all(box <= front_boxes, axis=1))
+        self.front = np.vstack((self.front[index_filter, :], x))
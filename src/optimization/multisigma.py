@@ -0,0 +1,101 @@
+import numpy as np
+
+from .ebo_stream import ebo
+
+
+class MultiSigmaEBOTracker:
+    """MultiSigmaEBOTracker which runs one EBOStreamTracker per threshold vector over a single pass of a stream. The
+    candidate sets of all threshold vectors are kept as rows of a boolean membership matrix over a shared pool of
+    elements which are a candidate for at least one of them.
+
+    Dominance does not depend on the thresholds, so an applicant is compared to each pooled element once, and the
+    differences on the first objective are computed once and compared against all thresholds at the same time. The
+    candidate sets, number_comparisons and max_candidates of each threshold vector are the same as those of a separate
+    EBOStreamTracker.
+    """
+
+    def __init__(self, slacks: np.ndarray):
+        self.slacks = np.atleast_2d(np.asarray(slacks, dtype=float))
+        self.number_slacks, self.dim = self.slacks.shape
+        self.number_comparisons = np.zeros(self.number_slacks, dtype=int)
+        self.max_candidates = np.ones(self.number_slacks, dtype=int)
+
+        # pooled elements in order of arrival, _member[s, j] is True iff element j is a candidate for slack s
+        self._pool = np.zeros((0, self.dim))
+        self._member = np.zeros((self.number_slacks, 0), dtype=bool)
+
+    def candidates(self, s: int):
+        """
+        Current candidate set of threshold vector s, sorted by the first objective like EBOStreamTracker.candidates.
+        """
+        members = self._pool[self._member[s], :]
+        return members[np.argsort(members[:, 0], kind='stable'), :]
+
+    @property
+    def decisions(self):
+        """
+        EBO decision of every threshold vector, one per row.
+        """
+        return np.array([ebo(self.candidates(s), self.slacks[s]) for s in range(self.number_slacks)])
+
+    def digest(self, x: np.ndarray):
+        """
+        Updates the candidate sets of all threshold vectors when a new input element is available.
+        :param x: new input element
+        :return:
+        """
+        current = np.reshape(x, (self.dim,))
+        pool = self._pool
+        member = self._member
+
+        if len(pool) == 0:
+            self._pool = current[np.newaxis, :]
+            self._member = np.ones((self.number_slacks, 1), dtype=bool)
+            return
+
+        slack_0 = self.slacks[:, 0]
+
+        # shared comparisons with the pooled elements
+        first = pool[:, 0]
+        dominated_by = np.all(current >= pool, axis=1)
+        dominates = np.all(pool > current, axis=1)
+        not_larger = first <= current[0]
+        within = first[np.newaxis, :] <= (current[0] + slack_0)[:, np.newaxis]
+
+        # the candidate with the smallest first objective discards the applicant on the first objective
+        smallest_first = np.where(member, first[np.newaxis, :], np.inf).min(axis=1)
+        rejected_first = current[0] > smallest_first + slack_0
+
+        # candidates which dominate the applicant, counted in order of arrival up to the first one which does
+        rejecters = member & dominated_by[np.newaxis, :]
+        rejected_dominated = np.invert(rejected_first) & rejecters.any(axis=1)
+        first_rejecter = np.argmax(rejecters, axis=1)
+        counted = member & not_larger[np.newaxis, :] & \
+            (np.arange(len(pool))[np.newaxis, :] <= first_rejecter[:, np.newaxis])
+
+        accepted = np.invert(rejected_first | rejected_dominated)
+
+        self.number_comparisons += np.where(rejected_first, 1, 0)
+        self.number_comparisons += np.where(rejected_dominated, counted.sum(axis=1), 0)
+        self.number_comparisons += np.where(accepted, (member & within).sum(axis=1), 0)
+
+        # accepting candidate sets drop the candidates discarded on the first objective or dominated by the applicant
+        evicted = np.invert(within) | dominates[np.newaxis, :]
+        member = member & np.invert(accepted[:, np.newaxis] & evicted)
+        member = np.hstack((member, accepted[:, np.newaxis]))
+        pool = np.vstack((pool, current))
+
+        used = member.any(axis=0)
+        self._pool = pool[used, :]
+        self._member = member[:, used]
+        self.max_candidates = np.maximum(self.max_candidates, self._member.sum(axis=1))
+
+    def digest_many(self, block: np.ndarray):
+        """
+        Updates the tracker with a block of input elements, equivalent to calling digest for each row in order.
+        :param block: applicant points, one per row
+        :return:
+        """
+        block = np.reshape(block, (-1, self.dim))
+        for i in range(len(block)):
+            self.digest(block[i, :])
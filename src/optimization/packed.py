@@ -0,0 +1,181 @@
+import numpy as np
+
+WORD_SIZE = 64
+
+
+def pack_rows(block: np.ndarray):
+    """
+    Packs a boolean block row-wise into uint64 words. Column j is stored in word j // 64 at bit 63 - j % 64.
+    :param block: boolean array of shape (m, n)
+    :return: uint64 array of shape (m, ceil(n / 64))
+    """
+    m, n = block.shape
+    number_words = -(-n // WORD_SIZE)
+
+    padded = np.zeros((m, number_words * WORD_SIZE), dtype=bool)
+    padded[:, :n] = block
+
+    packed_bytes = np.packbits(padded, axis=1)
+    return packed_bytes.view('>u8').astype(np.uint64)
+
+
+def unpack_rows(words: np.ndarray, n: int):
+    """
+    Unpacks uint64 words into a boolean block, inverse of pack_rows.
+    :param words: uint64 array of shape (m, ceil(n / 64))
+    :param n: number of columns
+    :return: boolean array of shape (m, n)
+    """
+    packed_bytes = np.ascontiguousarray(words.astype('>u8')).view(np.uint8)
+    return np.unpackbits(packed_bytes, axis=1)[:, :n].astype(bool)
+
+
+class PackedRelation:
+    """Bit-packed matrix representation of a relation on a set X with n elements. Each row is stored in ceil(n / 64)
+    uint64 words, which needs an eighth of the memory of a boolean matrix. The padding bits of the last word of each
+    row are always zero.
+    """
+
+    def __init__(self, words: np.ndarray, n: int):
+        self.words = words
+        self.n = n
+
+    @classmethod
+    def zeros(cls, n: int):
+        """
+        Creates the empty relation on n elements.
+        """
+        return cls(np.zeros((n, -(-n // WORD_SIZE)), dtype=np.uint64), n)
+
+    @classmethod
+    def identity(cls, n: int):
+        """
+        Creates the identity relation on n elements.
+        """
+        relation = cls.zeros(n)
+        index = np.arange(n)
+        relation.words[index, index // WORD_SIZE] = np.left_shift(np.uint64(1),
+                                                                  (WORD_SIZE - 1 - index % WORD_SIZE).astype(np.uint64))
+        return relation
+
+    @classmethod
+    def from_dense(cls, matrix: np.ndarray):
+        """
+        Packs a boolean n x n matrix.
+        """
+        return cls(pack_rows(matrix), len(matrix))
+
+    def to_dense(self):
+        """
+        Unpacks the relation into a boolean n x n matrix.
+        """
+        return unpack_rows(self.words, self.n)
+
+    @property
+    def shape(self):
+        return self.n, self.n
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, item):
+        """
+        Returns row i as boolean vector for an integer index, or the entry (i, j) for a tuple index.
+        """
+        if isinstance(item, tuple):
+            i, j = item
+            word = self.words[i, j // WORD_SIZE]
+            return bool((int(word) >> (WORD_SIZE - 1 - j % WORD_SIZE)) & 1)
+
+        if not -self.n <= item < self.n:
+            raise IndexError(f'index {item} is out of bounds for relation on {self.n} elements')
+        item %= self.n
+        return unpack_rows(self.words[item:item + 1, :], self.n)[0]
+
+    def set_rows(self, start: int, block: np.ndarray):
+        """
+        Overwrites the rows start, ..., start + len(block) - 1 with a boolean block.
+        """
+        self.words[start:start + len(block), :] = pack_rows(block)
+
+    def __or__(self, other: 'PackedRelation'):
+        return PackedRelation(np.bitwise_or(self.words, other.words), self.n)
+
+    def __and__(self, other: 'PackedRelation'):
+        return PackedRelation(np.bitwise_and(self.words, other.words), self.n)
+
+    def and_not(self, other: 'PackedRelation'):
+        """
+        Computes the relation self - other.
+        """
+        return PackedRelation(np.bitwise_and(self.words, np.invert(other.words)), self.n)
+
+    def or_rows(self, targets: np.ndarray, source: int):
+        """
+        Adds row source to each of the rows in targets in place.
+        """
+        self.words[targets, :] |= self.words[source, :]
+
+    def column(self, j: int):
+        """
+        Returns column j as boolean vector.
+        """
+        shift = np.uint64(WORD_SIZE - 1 - j % WORD_SIZE)
+        return (np.right_shift(self.words[:, j // WORD_SIZE], shift) & np.uint64(1)).astype(bool)
+
+    def transpose(self):
+        """
+        Computes the transposed relation, 64 rows at a time.
+        """
+        transposed = PackedRelation.zeros(self.n)
+
+        for w in range(self.words.shape[1]):
+            block = np.zeros((WORD_SIZE, self.n), dtype=bool)
+            rows = unpack_rows(self.words[w * WORD_SIZE:(w + 1) * WORD_SIZE, :], self.n)
+            block[:len(rows), :] = rows
+            transposed.words[:, w] = pack_rows(block.T)[:, 0]
+
+        return transposed
+
+    @property
+    def T(self):
+        return self.transpose()
+
+    def any(self, axis: int):
+        """
+        Tests whether any entry is set per column (axis=0) or per row (axis=1).
+        """
+        if axis == 0:
+            reduced = np.bitwise_or.reduce(self.words, axis=0)
+            return unpack_rows(reduced[np.newaxis, :], self.n)[0]
+
+        return self.words.any(axis=1)
+
+    def all(self, axis: int):
+        """
+        Tests whether all entries are set per column (axis=0) or per row (axis=1).
+        """
+        if axis == 0:
+            if self.n == 0:
+                return np.ones(0, dtype=bool)
+            reduced = np.bitwise_and.reduce(self.words, axis=0)
+            return unpack_rows(reduced[np.newaxis, :], self.n)[0]
+
+        full_row = pack_rows(np.ones((1, self.n), dtype=bool))
+        return (self.words == full_row).all(axis=1)
+
+    def nonzero(self, chunk_size: int = 1024):
+        """
+        Returns the indices of the pairs in relation like numpy.nonzero.
+        """
+        rows = []
+        cols = []
+        for start in range(0, self.n, chunk_size):
+            block_rows, block_cols = np.nonzero(unpack_rows(self.words[start:start + chunk_size, :], self.n))
+            rows.append(block_rows + start)
+            cols.append(block_cols)
+
+        if not rows:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+        return np.concatenate(rows), np.concatenate(cols)
@@ -0,0 +1,58 @@
+from typing import *
+
+import numpy as np
+import pandas as pd
+
+from .ebo_stream import EBOStreamTracker, ebo
+from .helpers import load_npy, data_chunks
+
+
+def read_points(source: Union[str, Iterable], chunk_size: int = 1024, dtype: np.dtype = None):
+    """
+    Reads input elements lazily in blocks of at most chunk_size rows. Only one block is held in memory at a time.
+    :param source: path of a csv file with a header row, path of a .npy file, or any iterable of points
+    :param chunk_size: number of rows per block
+    :param dtype: data type of the values, e.g. np.float32, None to keep the type of the source
+    :return: generator of blocks of shape (m, dim)
+    """
+    if isinstance(source, str) and source.endswith('.npy'):
+        for block in data_chunks(load_npy(source), chunk_size):
+            yield np.asarray(block, dtype=dtype)
+    elif isinstance(source, str):
+        for chunk in pd.read_csv(source, chunksize=chunk_size, dtype=dtype):
+            yield chunk.values
+    else:
+        block = []
+        for x in source:
+            block.append(np.ravel(x))
+            if len(block) == chunk_size:
+                yield np.asarray(block, dtype=dtype)
+                block = []
+        if block:
+            yield np.asarray(block, dtype=dtype)
+
+
+def stream_ebo(source: Union[str, Iterable], slack: List[float], chunk_size: int = 1024, checkpoint: int = 1):
+    """
+    Runs the EBO procedure over a stream of input elements with memory bounded by the candidate set. The elements are
+    read with read_points and digested by an EBOStreamTracker, after every checkpoint blocks and after the last block
+    the current decision is reported.
+    :param source: path of a csv file, path of a .npy file, or any iterable of points
+    :param slack: threshold parameters
+    :param chunk_size: number of rows per block
+    :param checkpoint: number of blocks between two reports
+    :return: generator of tuples (number of elements digested, current decision, number of candidates)
+    """
+    tracker = EBOStreamTracker(slack)
+    number_points = 0
+    reported = 0
+
+    for k, block in enumerate(read_points(source, chunk_size), start=1):
+        tracker.digest_many(block)
+        number_points += len(block)
+        if k % checkpoint == 0:
+            reported = number_points
+            yield number_points, ebo(tracker.candidates, slack), len(tracker.candidates)
+
+    if reported < number_points:
+        yield number_points, ebo(tracker.candidates, slack), len(tracker.candidates)
@@ -0,0 +1,117 @@
+import asyncio
+import time
+from typing import *
+
+import numpy as np
+
+from .ebo_stream import EBOStreamTracker, ebo
+
+
+class EBOService:
+    """EBOService which feeds the points of many asyncio producers into one EBOStreamTracker. Submitted points wait in a
+    bounded queue, so producers are suspended while it is full, and a worker task digests them in micro-batches of at
+    most max_batch_size points. The latency from submission to digestion is summarized per batch. If a batch fails, the
+    worker keeps draining the queue and the first error is raised by current_decision and stop.
+
+    Usage:
+        async with EBOService(slack) as service:
+            await service.submit(point)
+            decision = await service.current_decision()
+    """
+
+    def __init__(self, slack: List[float], max_queue_size: int = 1024, max_batch_size: int = 256,
+                 percentiles: List[float] = (50, 90, 99)):
+        self.slack = slack
+        self.tracker = EBOStreamTracker(slack)
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.percentiles = percentiles
+
+        # one entry per digested batch with its size and latency percentiles in seconds
+        self.batch_stats = []
+
+        self._queue = None
+        self._worker = None
+        self._error = None
+        self._traceback = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    async def start(self):
+        """
+        Starts the worker task on the running event loop.
+        """
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        """
+        Digests all submitted points and stops the worker task.
+        """
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._raise_error()
+
+    async def submit(self, point: np.ndarray):
+        """
+        Submits a point, waiting while the queue is full.
+        :param point: new input element, converted to a float vector before it is queued
+        :return:
+        """
+        point = np.reshape(np.asarray(point, dtype=float), (self.tracker.dim,))
+        self._raise_error()
+        await self._queue.put((point, time.perf_counter()))
+
+    async def current_decision(self):
+        """
+        Waits until all points submitted so far are digested and returns the EBO decision, None if there are none.
+        """
+        await self._queue.join()
+        self._raise_error()
+        if self.tracker.candidates is None:
+            return None
+        return ebo(self.tracker.candidates, self.slack)
+
+    async def _run(self):
+        """
+        Takes batches from the queue and digests them until cancelled.
+        """
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                self.tracker.digest_many(np.array([point for point, _ in batch]))
+
+                digested = time.perf_counter()
+                latencies = [digested - submitted for _, submitted in batch]
+                stats = {'size': len(batch)}
+                for q, latency in zip(self.percentiles, np.percentile(latencies, self.percentiles)):
+                    stats[f'latency_p{q:g}'] = float(latency)
+                self.batch_stats.append(stats)
+            except Exception as error:
+                # keep the first error, waiting producers and callers must not hang on the queue; the traceback is
+                # kept without the frame of the worker, which keeps running
+                if self._error is None:
+                    self._error = error
+                    self._traceback = error.__traceback__.tb_next
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _raise_error(self):
+        """
+        Raises the error of a failed batch, if any.
+        """
+        if self._error is not None:
+            raise self._error.with_traceback(self._traceback)
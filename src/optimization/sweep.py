@@ -0,0 +1,106 @@
+from typing import *
+
+import numpy as np
+
+from .minimals import SemiorderRelation
+
+
+class ThresholdSweep:
+    """ThresholdSweep which evaluates the lexicographic semiorder on one set X for every threshold vector of a grid.
+
+    For each objective i and each pair (x, y) the number of grid thresholds s with x_i + s < y_i is computed once.
+    Since x_i + s is non-decreasing in s, x strictly precedes y in dim i for the k-th threshold iff this
+    count exceeds k, so the relation for every grid cell follows from integer comparisons and equals adjacency_matrix.
+    The cells are enumerated objective by objective, reusing the partially decided relation of all cells sharing the
+    thresholds of the first objectives.
+    """
+
+    def __init__(self, data_set: np.ndarray, sigma_grids: List[List[float]]):
+        """
+        :param data_set: input set X
+        :param sigma_grids: ascending threshold values for each objective
+        """
+        self.data_set = data_set
+        self.sigma_grids = [np.asarray(grid, dtype=float) for grid in sigma_grids]
+        self.dim = len(sigma_grids)
+        self.n = len(data_set)
+
+        self._counts = [self._precedence_counts(i) for i in range(self.dim)]
+        # contiguous transposes, counting the thresholds with y_i + s < x_i
+        self._counts_transposed = [np.ascontiguousarray(counts.T) for counts in self._counts]
+
+    @property
+    def grid_shape(self):
+        return tuple(len(grid) for grid in self.sigma_grids)
+
+    def _precedence_counts(self, i: int):
+        """
+        Computes for every pair (x, y) the number of thresholds s of the grid of objective i with x_i + s < y_i.
+        :param i: objective
+        :return: array of shape (n, n)
+        """
+        grid = self.sigma_grids[i]
+        counts = np.zeros((self.n, self.n), dtype=np.min_scalar_type(len(grid)))
+
+        x_i = self.data_set[:, i][:, np.newaxis]
+        y_i = self.data_set[:, i][np.newaxis, :]
+        for s in grid:
+            counts += x_i + s < y_i
+
+        return counts
+
+    def sigma(self, levels: Tuple[int, ...]):
+        """
+        Threshold vector of the grid cell levels.
+        """
+        return [float(self.sigma_grids[i][k]) for i, k in enumerate(levels)]
+
+    def adjacency_matrices(self):
+        """
+        Enumerates the adjacency matrices of R for all grid cells in row-major order.
+        :return: generator of (levels, adjacency matrix)
+        """
+        rows = np.ones((self.n, self.n), dtype=bool)
+        undecided = np.ones((self.n, self.n), dtype=bool)
+
+        return self._descend(0, (), rows, undecided)
+
+    def _descend(self, i: int, levels: Tuple[int, ...], rows: np.ndarray, undecided: np.ndarray):
+        """
+        Refines the relation decided by the objectives before i for every threshold of objective i.
+        """
+        if i == self.dim:
+            yield levels, rows
+            return
+
+        counts = self._counts[i]
+        counts_transposed = self._counts_transposed[i]
+        for k in range(len(self.sigma_grids[i])):
+            # x strictly precedes y and y strictly precedes x in dim i
+            precedes = counts > k
+            succeeds = counts_transposed > k
+
+            yield from self._descend(i + 1, levels + (k,), rows & np.invert(undecided & succeeds),
+                                     undecided & np.invert(precedes | succeeds))
+
+    def relations(self):
+        """
+        Enumerates a SemiorderRelation for every grid cell in row-major order.
+        :return: generator of (levels, relation)
+        """
+        for levels, a_matrix in self.adjacency_matrices():
+            yield levels, SemiorderRelation(self.data_set, self.sigma(levels), a_matrix=a_matrix)
+
+    def count_minimals(self, method: str = 'reach'):
+        """
+        Computes the number of minimal elements, e.g. bottom cycles, for every grid cell. The default 'reach' method
+        needs a few searches on packed rows per cell instead of a pass of Tarjan's algorithm over all elements.
+        :param method: 'reach', 'scc', 'index' or 'closure', see minimal_cycles
+        :return: array of shape grid_shape
+        """
+        number_minimals = np.zeros(self.grid_shape, dtype=int)
+
+        for levels, relation in self.relations():
+            number_minimals[levels] = np.count_nonzero(relation.minimal_cycles_index(method))
+
+        return number_minimals
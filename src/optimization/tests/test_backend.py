@@ -0,0 +1,76 @@
+import unittest
+
+import numpy as np
+
+from optimization import backend
+from optimization.ebo_stream import EBOStreamTracker, _scan_candidates, _digest_block
+from optimization.minimals import warshall, adjacency_matrix, adj_matrix_strict, trans_closure
+
+
+class BackendTest(unittest.TestCase):
+    def tearDown(self):
+        backend.set_backend('python')
+
+    def test_set_backend(self):
+        with self.assertRaises(ValueError):
+            backend.set_backend('cython')
+        if backend.numba is None:
+            with self.assertRaises(ImportError):
+                backend.set_backend('numba')
+        self.assertEqual(backend.get_backend(), 'python')
+
+    def test_scan_candidates(self):
+        random_state = np.random.RandomState(0)
+        for _ in range(100):
+            candidates = np.round(random_state.rand(20, 3), 1)
+            candidates = candidates[np.argsort(candidates[:, 0], kind='stable'), :]
+            arrival = random_state.permutation(20)
+            current = np.round(random_state.rand(3), 1)
+            middle = np.searchsorted(candidates[:, 0], current[0], side='right')
+            upper = np.searchsorted(candidates[:, 0], current[0] + 0.3, side='right')
+
+            count, keep = _scan_candidates(candidates, arrival, current, middle, upper)
+
+            rejected = np.all(current >= candidates[:middle, :], axis=1)
+            if rejected.any():
+                self.assertEqual(count, np.count_nonzero(arrival[:middle] <= arrival[:middle][rejected].min()))
+            else:
+                self.assertEqual(count, -1)
+                expected = middle + np.flatnonzero(np.invert(np.all(candidates[middle:upper, :] > current, axis=1)))
+                self.assertTrue(np.array_equal(keep, expected))
+
+    def test_digest_block(self):
+        random_state = np.random.RandomState(2)
+        for _ in range(20):
+            sigma = np.round(random_state.rand(3) * 0.3, 1).tolist()
+            data_set = np.round(random_state.rand(100, 3), 1)
+            tracker = EBOStreamTracker(sigma)
+            tracker.digest_many(data_set)
+
+            buffer = np.empty((len(data_set), 3))
+            arrival = np.empty(len(data_set), dtype=int)
+            size, _, number_comparisons, max_candidates = _digest_block(_scan_candidates, buffer, arrival, 0, 0,
+                                                                        data_set, sigma[0], 1)
+            self.assertTrue(np.array_equal(buffer[:size, :], tracker.candidates))
+            self.assertEqual(number_comparisons, tracker.number_comparisons)
+            self.assertEqual(max_candidates, tracker.max_candidates)
+
+    @unittest.skipIf(backend.numba is None, 'numba is not installed')
+    def test_numba_backend(self):
+        sigma = [0.1, 0.2]
+        data_set = np.round(np.random.RandomState(1).rand(60, 2), 1)
+        a_strict_matrix = adj_matrix_strict(adjacency_matrix(data_set, sigma))
+
+        python_tracker = EBOStreamTracker(sigma)
+        python_tracker.digest_many(data_set[:10].astype(np.float32))
+        python_tracker.digest_many(data_set[10:])
+
+        backend.set_backend('numba')
+        numba_tracker = EBOStreamTracker(sigma, initial_capacity=1)
+        numba_tracker.digest_many(data_set[:10].astype(np.float32))
+        numba_tracker.digest_many(data_set[10:])
+
+        self.assertTrue(np.array_equal(warshall(a_strict_matrix), trans_closure(a_strict_matrix)))
+        self.assertTrue(np.array_equal(numba_tracker.candidates, python_tracker.candidates))
+        self.assertEqual(numba_tracker.number_comparisons, python_tracker.number_comparisons)
+        self.assertEqual(numba_tracker.max_candidates, python_tracker.max_candidates)
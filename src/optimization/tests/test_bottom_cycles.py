@@ -3,8 +3,10 @@ import unittest
 import numpy as np
 
 from optimization.minimals import lex_semiorder_comparison, adjacency_matrix, adj_matrix_strict, warshall, \
-    minimal_cycles, trans_closure
-from optimization.minimals import ebo
+    minimal_cycles, trans_closure, strongly_connected_components, minimal_diamond, minimal_small, SemiorderRelation, \
+    ReachabilityIndex, _sweep_minimals, bottom_cycles_reach, bottom_cycles_scc
+from optimization.ebo_stream import ebo
+from optimization.packed import PackedRelation
 
 
 class MinTrackerTest(unittest.TestCase):
@@ -34,6 +36,14 @@ class MinTrackerTest(unittest.TestCase):
         a = adjacency_matrix(data_set, sigma)
         self.assertTrue(a.all())
 
+    def test_adjacency_matrix_pairwise(self):
+        sigma = [0.1, 0.2, 0.3]
+        data_set = np.round(np.random.rand(40, 3), 1)
+        a = adjacency_matrix(data_set, sigma, chunk_size=7)
+        for i in range(len(data_set)):
+            for j in range(len(data_set)):
+                self.assertEqual(a[i, j], lex_semiorder_comparison(data_set[i, :], data_set[j, :], sigma))
+
     def test_simple_adj_strict(self):
         sigma = [0.1, 0.2, 0.3]
         x = [1, 2, 3]
@@ -103,6 +113,90 @@ class MinTrackerTest(unittest.TestCase):
             for j in range(3):
                 self.assertEqual(data_set[i, j], minimals[i, j])
 
+    def test_scc(self):
+        a_strict = np.zeros((5, 5), dtype=bool)
+        a_strict[0, 1] = a_strict[1, 2] = a_strict[2, 0] = True
+        a_strict[2, 3] = a_strict[3, 4] = True
+        components = strongly_connected_components(a_strict)
+        self.assertEqual(components[0], components[1])
+        self.assertEqual(components[1], components[2])
+        self.assertEqual(len(set(components)), 3)
+
+    def test_minimals_methods(self):
+        sigma = [0.1, 0.2]
+        for k in range(20):
+            data_set = np.random.rand(30, 2)
+            scc = minimal_cycles(data_set, sigma, method='scc')
+            closure = minimal_cycles(data_set, sigma, method='closure')
+            reach = minimal_cycles(data_set, sigma, method='reach')
+            self.assertTrue(np.array_equal(scc, closure))
+            self.assertTrue(np.array_equal(scc, reach))
+
+    def test_bottom_cycles_reach(self):
+        for k in range(50):
+            n = np.random.randint(1, 100)
+            a_strict = np.random.rand(n, n) < 0.05
+            np.fill_diagonal(a_strict, False)
+            self.assertTrue(np.array_equal(bottom_cycles_reach(a_strict, chunk_size=7), bottom_cycles_scc(a_strict)))
+
+    def test_minimals_sweep(self):
+        for k in range(200):
+            dim = np.random.randint(1, 4)
+            n = np.random.randint(1, 15)
+            sigma = list(np.random.choice([0, 0.1, 0.2, 0.5], dim))
+            data_set = np.round(np.random.rand(n, dim), 1)
+            for minimal in [minimal_diamond, minimal_small]:
+                sweep = minimal(data_set, sigma, method='sweep')
+                matrix = minimal(data_set, sigma, method='matrix')
+                self.assertTrue(np.array_equal(sweep, matrix))
+
+    def test_minimals_sweep_blocks(self):
+        # sigma_0 spans the data, so every element is a candidate
+        for k in range(50):
+            dim = np.random.randint(1, 4)
+            data_set = np.round(np.random.rand(40, dim), 1)
+            sigma = [1] + list(np.random.choice([0, 0.1, 0.2], dim - 1))
+            relation = SemiorderRelation(data_set, sigma)
+            for strict in [False, True]:
+                matrix = relation.minimal_small_index('matrix') if strict else relation.minimal_diamond_index('matrix')
+                for block_size in [1, 7, 1 << 22]:
+                    sweep = _sweep_minimals(data_set, sigma, strict, block_size=block_size)
+                    self.assertTrue(np.array_equal(sweep, matrix))
+
+    def test_semiorder_relation(self):
+        sigma = [0.1, 0.2, 0.3]
+        x = [1, 3, 3]
+        y = [1.1, 2, 3]
+        z = [1.2, 1, 3]
+        w = [2, 0, 3]
+        data_set = np.vstack((x, y, z, w))
+        relation = SemiorderRelation(data_set, sigma)
+        a_matrix = relation.a_matrix
+        self.assertTrue(np.array_equal(relation.minimal_cycles(), data_set[:3, :]))
+        self.assertTrue(np.array_equal(relation.minimal_cycles('closure'), data_set[:3, :]))
+        self.assertIs(relation.a_matrix, a_matrix)
+        self.assertTrue(np.array_equal(relation.cycle_members(1), [0, 1, 2]))
+        self.assertTrue(np.array_equal(relation.cycle_members(3), [3]))
+        for method in ['sweep', 'matrix']:
+            self.assertEqual(len(relation.minimal_diamond(method)), 0)
+            self.assertEqual(len(relation.minimal_small(method)), 0)
+
+    def test_reachability_index(self):
+        random_state = np.random.RandomState(5)
+        for n in [0, 1, 50, 150]:
+            data_set = np.round(random_state.rand(n, 3), 1)
+            sigma = [0.2, 0.1, 0.3]
+            a_strict_matrix = adj_matrix_strict(adjacency_matrix(data_set, sigma))
+            index = ReachabilityIndex(a_strict_matrix)
+            elements = np.arange(n)
+            self.assertTrue(np.array_equal(index.reaches(elements[:, np.newaxis], elements[np.newaxis, :]),
+                                           trans_closure(a_strict_matrix)))
+            chunked = ReachabilityIndex(PackedRelation.from_dense(a_strict_matrix), chunk_size=7)
+            self.assertTrue(np.array_equal(chunked.labels.words, index.labels.words))
+            relation = SemiorderRelation(data_set, sigma, packed=True)
+            self.assertTrue(np.array_equal(relation.minimal_cycles('index'), relation.minimal_cycles('scc')))
+        self.assertTrue(np.array_equal(index.descendants(3), trans_closure(a_strict_matrix)[3]))
+
     def test_ebo(self):
         sigma = [0.1, 0.2, 0.3]
         x = [1, 3, 3]
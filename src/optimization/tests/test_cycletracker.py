@@ -0,0 +1,27 @@
+import unittest
+
+import numpy as np
+
+from optimization.cycletracker import BottomCycleTracker
+from optimization.minimals import minimal_cycles
+
+
+class BottomCycleTrackerTest(unittest.TestCase):
+    def test_prefixes(self):
+        random_state = np.random.RandomState(0)
+        for sigma in [[0.1, 0.2], [0.2, 0.2, 0.2], [0.05], [0, 0]]:
+            data_set = np.round(random_state.rand(60, len(sigma)), 2)
+            tracker = BottomCycleTracker(sigma, initial_capacity=1)
+            for i in range(len(data_set)):
+                tracker.digest(data_set[i, :])
+                self.assertTrue(np.array_equal(tracker.minimals, minimal_cycles(data_set[:i + 1, :], sigma)))
+
+    def test_cycle(self):
+        sigma = [0.1, 0.2, 0.3]
+        tracker = BottomCycleTracker(sigma)
+        for x in [[1, 3, 3], [1.1, 2, 3], [1.2, 1, 3]]:
+            tracker.digest(np.array(x))
+        self.assertEqual(len(tracker.minimals), 3)
+        tracker.digest(np.array([1.3, 0, 3]))
+        tracker.digest(np.array([1.1, 4, 3]))
+        self.assertEqual(len(tracker.minimals), 5)
@@ -0,0 +1,143 @@
+import unittest
+
+import numpy as np
+
+from optimization.ebo_stream import EBOStreamTracker, DigestStats, ebo, ebo_batch, sharded_ebo
+
+
+class ReferenceTracker:
+    """
+    Scalar version of EBOStreamTracker, scanning the candidates one by one.
+    """
+
+    def __init__(self, slack):
+        self.slack = slack
+        self.candidates = None
+        self.dim = len(slack)
+        self.number_comparisons = 0
+        self.max_candidates = 1
+
+    def digest(self, x: np.ndarray):
+        x = np.reshape(x, (1, self.dim))
+        if self.candidates is None:
+            self.candidates = x
+            return
+
+        current = x[0]
+        index_filter = np.ones(len(self.candidates), dtype=bool)
+        for j in range(len(self.candidates)):
+            self.number_comparisons += 1
+            y = self.candidates[j, :]
+            if current[0] > y[0] + self.slack[0]:
+                return
+            if y[0] > current[0] + self.slack[0]:
+                index_filter[j] = False
+                continue
+            if all(np.greater_equal(current, y)):
+                return
+            if all(np.greater(y, current)):
+                index_filter[j] = False
+                continue
+
+        self.candidates = np.vstack((self.candidates[index_filter, :], x))
+        self.max_candidates = max(self.max_candidates, len(self.candidates))
+
+
+def sort_rows(data_set: np.ndarray):
+    return data_set[np.lexsort(data_set.T[::-1]), :]
+
+
+class EBOStreamTrackerTest(unittest.TestCase):
+    def test_digest(self):
+        for dim in [1, 2, 3]:
+            slack = [0.2] * dim
+            data_set = np.round(np.random.RandomState(dim).rand(200, dim), 2)
+            tracker = EBOStreamTracker(slack)
+            reference = ReferenceTracker(slack)
+            for i in range(len(data_set)):
+                tracker.digest(data_set[i, :])
+                reference.digest(data_set[i, :])
+            self.assertTrue(np.array_equal(sort_rows(tracker.candidates), sort_rows(reference.candidates)))
+            self.assertLessEqual(tracker.number_comparisons, reference.number_comparisons)
+            self.assertEqual(tracker.max_candidates, reference.max_candidates)
+            self.assertTrue(np.all(np.diff(tracker.candidates[:, 0]) >= 0))
+            self.assertTrue(np.array_equal(ebo(tracker.candidates, slack), ebo(data_set, slack)))
+
+    def test_digest_many(self):
+        slack = [0.1, 0.2, 0.1]
+        data_set = np.random.rand(500, 3)
+        tracker = EBOStreamTracker(slack)
+        batched = EBOStreamTracker(slack)
+        for i in range(len(data_set)):
+            tracker.digest(data_set[i, :])
+        for block in np.array_split(data_set, 7):
+            batched.digest_many(block)
+        self.assertTrue(np.array_equal(tracker.candidates, batched.candidates))
+        self.assertEqual(tracker.number_comparisons, batched.number_comparisons)
+        self.assertEqual(tracker.max_candidates, batched.max_candidates)
+
+    def test_candidates_view(self):
+        slack = [0.3, 0.3]
+        tracker = EBOStreamTracker(slack, initial_capacity=1)
+        self.assertIsNone(tracker.candidates)
+        data_set = np.random.rand(100, 2)
+        tracker.digest_many(data_set)
+        candidates = tracker.candidates
+        self.assertTrue(np.shares_memory(candidates, tracker.candidates))
+        self.assertEqual(len(candidates), tracker._size)
+
+    def test_dtype_promotion(self):
+        slack = [0, 0]
+        data_set = [np.array([0.5, 0.5], dtype=np.float32), np.array([0.1000000001, 0.9]),
+                    np.array([0.1000000002, 0.1])]
+        tracker = EBOStreamTracker(slack)
+        for x in data_set:
+            tracker.digest(x)
+        self.assertEqual(tracker.candidates.dtype, np.float64)
+        self.assertTrue(np.array_equal(ebo(tracker.candidates, slack), ebo(np.vstack(data_set), slack)))
+
+    def test_ebo_batch(self):
+        random_state = np.random.RandomState(0)
+        data_sets = np.round(random_state.rand(20, 30, 3), 1)
+        sigmas = np.round(random_state.rand(15, 3) * 0.3, 2)
+        decisions = ebo_batch(data_sets, sigmas)
+        self.assertEqual(decisions.shape, (20, 15, 3))
+        for b in range(len(data_sets)):
+            for s in range(len(sigmas)):
+                self.assertTrue(np.array_equal(decisions[b, s, :], ebo(data_sets[b], list(sigmas[s]))))
+        self.assertEqual(ebo_batch(data_sets[0], sigmas).shape, (15, 3))
+        self.assertEqual(ebo_batch(data_sets, sigmas[0]).shape, (20, 3))
+        self.assertTrue(np.array_equal(ebo_batch(data_sets[0], sigmas[0]), ebo(data_sets[0], list(sigmas[0]))))
+
+    def test_sharded_ebo(self):
+        slack = [0.1, 0.05, 0.1]
+        data_set = np.round(np.random.RandomState(3).rand(2000, 3), 2)
+        for number_shards, max_workers in [(1, 1), (7, 1), (4, 2)]:
+            decision, shard_comparisons, merge_comparisons = sharded_ebo(data_set, slack, number_shards, max_workers)
+            self.assertTrue(np.array_equal(decision, ebo(data_set, slack)))
+            self.assertEqual(len(shard_comparisons), number_shards)
+            self.assertGreaterEqual(merge_comparisons, 0)
+
+    def test_stats(self):
+        slack = [0.2, 0.1]
+        data_set = np.round(np.random.RandomState(4).rand(300, 2), 2)
+        tracker = EBOStreamTracker(slack)
+        recorded = EBOStreamTracker(slack, stats=DigestStats())
+        tracker.digest_many(data_set)
+        recorded.digest_many(data_set[:100])
+        for i in range(100, len(data_set)):
+            recorded.digest(data_set[i, :])
+        self.assertTrue(np.array_equal(tracker.candidates, recorded.candidates))
+        self.assertEqual(tracker.number_comparisons, recorded.number_comparisons)
+
+        summary = recorded.stats.as_dict()
+        self.assertEqual(summary['digests'], len(data_set))
+        self.assertEqual(summary['accepted'] + summary['rejected_first_objective'] + summary['rejected_dominated'],
+                         len(data_set))
+        self.assertEqual(summary['accepted'] - summary['evictions'], len(recorded.candidates))
+        self.assertEqual(sum(summary['size_histogram']), len(data_set))
+        self.assertEqual(len(summary['size_histogram']) - 1, recorded.max_candidates)
+
+        frame = recorded.stats.to_dataframe()
+        self.assertEqual(list(frame.columns), ['outcome', 'evictions', 'size', 'wall_time'])
+        self.assertEqual(len(frame), len(data_set))
@@ -0,0 +1,30 @@
+import unittest
+
+from optimization.ebo_stream import EBOStreamTracker
+from optimization.experiments import run_experiment
+from optimization.helpers import create_random_points
+
+
+def trial(cell, random_state):
+    n, dim, sigma = cell
+    tracker = EBOStreamTracker(sigma)
+    tracker.digest_many(create_random_points(dim, n, random_state))
+    return tracker.max_candidates, tracker.number_comparisons
+
+
+class ExperimentsTest(unittest.TestCase):
+    def test_reproducible(self):
+        cells = [(n, 3, [0.2, 0.2, 0.2]) for n in [10, 20, 30]]
+        sequential = run_experiment(trial, cells, 25, seed=1, max_workers=1, chunk_size=10)
+        parallel = run_experiment(trial, cells, 25, seed=1, max_workers=2, chunk_size=7)
+        self.assertEqual(sequential, parallel)
+        self.assertEqual(len(sequential), 3)
+        for result in sequential:
+            self.assertEqual(len(result), 6)
+            self.assertLessEqual(result[0], result[1])
+            self.assertLessEqual(result[1], result[2])
+
+    def test_seed(self):
+        cells = [(10, 2, [0.1, 0.1])]
+        self.assertNotEqual(run_experiment(trial, cells, 10, seed=1, max_workers=1),
+                            run_experiment(trial, cells, 10, seed=2, max_workers=1))
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from optimization.ebo_stream import EBOStreamTracker
+from optimization.helpers import set_subtraction, set_subtraction_index, get_data_from_csv, convert_csv_to_npy, \
+    load_npy, data_chunks
+
+RESOURCES = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'resources')
+
+
+class HelpersTest(unittest.TestCase):
+    def test_set_subtraction(self):
+        set_a = np.round(np.random.rand(100, 3), 1)
+        set_b = set_a[::3, :].copy()
+        difference = set_subtraction(set_a, set_b)
+        expected = [x for x in set_a if not any(all(x == y) for y in set_b)]
+        self.assertTrue(np.array_equal(difference, np.reshape(expected, (-1, 3))))
+        self.assertTrue(np.array_equal(set_subtraction(set_a, None), set_a))
+
+    def test_set_subtraction_index(self):
+        set_a = np.array([[0.0, 1.0], [1.0, 2.0], [np.nan, 1.0], [2.0, 2.0]])
+        set_b = np.array([[-0.0, 1.0], [np.nan, 1.0], [2, 2]])
+        self.assertTrue(np.array_equal(set_subtraction_index(set_a, set_b), [False, True, True, False]))
+        self.assertTrue(set_subtraction_index(set_a, np.zeros((0, 2))).all())
+
+    def test_npy_conversion(self):
+        data_values = get_data_from_csv('inputData.csv', directory=RESOURCES)
+        with tempfile.TemporaryDirectory() as directory:
+            npy_path = os.path.join(directory, 'inputData.npy')
+            shape = convert_csv_to_npy(os.path.join(RESOURCES, 'inputData.csv'), npy_path, chunk_size=4)
+            self.assertEqual(shape, data_values.shape)
+            stored = load_npy(npy_path)
+            self.assertEqual(stored.dtype, np.float32)
+            self.assertTrue(np.allclose(stored, data_values))
+            chunks = list(data_chunks(stored, 5))
+            self.assertEqual(len(chunks), 5)
+            self.assertTrue(all(np.shares_memory(chunk, stored) for chunk in chunks))
+            tracker = EBOStreamTracker([0.2, 0.2])
+            for chunk in chunks:
+                tracker.digest_many(chunk)
+            self.assertEqual(tracker.candidates.dtype, np.float32)
+            del stored, chunks
@@ -2,6 +2,7 @@ import unittest
 
 import numpy as np
 
+from optimization.minimals import adjacency_matrix, adj_matrix_strict
 from optimization.mintracker import ExactMinTracker, ApproximateMinTracker
 
 
@@ -50,3 +51,15 @@ class MinTrackerTest(unittest.TestCase):
         for i in range(10):
             mintracker.update_mintracker_approx(x2)
         self.assertEqual(mintracker.candidates.size, size)
+
+    def test_exact_minimals(self):
+        slack = [0.1, 0.2]
+        data_set = np.random.RandomState(0).rand(300, 2)
+        mintracker = ExactMinTracker(slack)
+        for i in range(len(data_set)):
+            mintracker.update_mintracker_exact(data_set[i, :])
+        a_strict = adj_matrix_strict(adjacency_matrix(data_set, slack))
+        minimals = data_set[np.invert(a_strict.any(axis=0)), :]
+        self.assertEqual(len(minimals), len(mintracker.candidates))
+        for x in minimals:
+            self.assertTrue(np.all(mintracker.candidates == x, axis=1).any())
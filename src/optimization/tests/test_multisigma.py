@@ -0,0 +1,25 @@
+import unittest
+
+import numpy as np
+
+from optimization.ebo_stream import EBOStreamTracker, ebo
+from optimization.multisigma import MultiSigmaEBOTracker
+
+
+class MultiSigmaEBOTrackerTest(unittest.TestCase):
+    def test_digest(self):
+        random_state = np.random.RandomState(0)
+        for dim in [1, 2, 3]:
+            data_set = np.round(random_state.rand(300, dim), 2)
+            slacks = np.round(random_state.rand(12, dim) * 0.3, 2)
+            tracker = MultiSigmaEBOTracker(slacks)
+            tracker.digest_many(data_set)
+
+            for s in range(len(slacks)):
+                reference = EBOStreamTracker(slacks[s].tolist())
+                for i in range(len(data_set)):
+                    reference.digest(data_set[i, :])
+                self.assertTrue(np.array_equal(tracker.candidates(s), reference.candidates))
+                self.assertEqual(tracker.number_comparisons[s], reference.number_comparisons)
+                self.assertEqual(tracker.max_candidates[s], reference.max_candidates)
+                self.assertTrue(np.array_equal(tracker.decisions[s], ebo(data_set, slacks[s])))
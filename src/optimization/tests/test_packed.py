@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+
+from optimization.minimals import adjacency_matrix, adj_matrix_strict, trans_closure, minimal_cycles, \
+    minimal_diamond, minimal_small, strongly_connected_components, bottom_cycles_scc
+from optimization.packed import PackedRelation
+
+
+class PackedRelationTest(unittest.TestCase):
+    def test_pack_unpack(self):
+        for n in [1, 63, 64, 65, 130]:
+            matrix = np.random.rand(n, n) > 0.5
+            relation = PackedRelation.from_dense(matrix)
+            self.assertTrue(np.array_equal(relation.to_dense(), matrix))
+            self.assertTrue(np.array_equal(relation.transpose().to_dense(), matrix.T))
+            self.assertTrue(np.array_equal(relation[n - 1], matrix[n - 1, :]))
+            self.assertTrue(np.array_equal(relation[-1], matrix[-1, :]))
+            self.assertEqual(relation[0, n - 1], matrix[0, n - 1])
+
+    def test_operations(self):
+        n = 70
+        a = np.random.rand(n, n) > 0.5
+        b = np.random.rand(n, n) > 0.5
+        packed_a = PackedRelation.from_dense(a)
+        packed_b = PackedRelation.from_dense(b)
+        self.assertTrue(np.array_equal((packed_a | packed_b).to_dense(), a | b))
+        self.assertTrue(np.array_equal((packed_a & packed_b).to_dense(), a & b))
+        self.assertTrue(np.array_equal(packed_a.and_not(packed_b).to_dense(), a & ~b))
+        self.assertTrue(np.array_equal(PackedRelation.identity(n).to_dense(), np.identity(n, dtype=bool)))
+        for axis in [0, 1]:
+            self.assertTrue(np.array_equal(packed_a.any(axis=axis), a.any(axis=axis)))
+            self.assertTrue(np.array_equal(packed_a.all(axis=axis), a.all(axis=axis)))
+        full = PackedRelation.from_dense(np.ones((n, n), dtype=bool))
+        self.assertTrue(full.all(axis=0).all())
+        self.assertTrue(full.all(axis=1).all())
+        rows, cols = packed_a.nonzero(chunk_size=16)
+        self.assertTrue(np.array_equal(rows, np.nonzero(a)[0]))
+        self.assertTrue(np.array_equal(cols, np.nonzero(a)[1]))
+
+    def test_relations(self):
+        sigma = [0.1, 0.2]
+        data_set = np.random.rand(80, 2)
+        a = adjacency_matrix(data_set, sigma)
+        packed = adjacency_matrix(data_set, sigma, chunk_size=13, packed=True)
+        self.assertTrue(np.array_equal(packed.to_dense(), a))
+        a_strict = adj_matrix_strict(a)
+        packed_strict = adj_matrix_strict(packed)
+        self.assertTrue(np.array_equal(packed_strict.to_dense(), a_strict))
+        self.assertTrue(np.array_equal(trans_closure(packed_strict).to_dense(), trans_closure(a_strict)))
+
+    def test_components(self):
+        for n in [1, 64, 150]:
+            a_strict = np.random.rand(n, n) < 0.02
+            np.fill_diagonal(a_strict, False)
+            packed = PackedRelation.from_dense(a_strict)
+            self.assertTrue(np.array_equal(strongly_connected_components(packed),
+                                           strongly_connected_components(a_strict)))
+            self.assertTrue(np.array_equal(bottom_cycles_scc(packed, chunk_size=7), bottom_cycles_scc(a_strict)))
+
+    def test_minimals(self):
+        sigma = [0.1, 0.2]
+        for k in range(10):
+            data_set = np.random.rand(30, 2)
+            for method in ['scc', 'closure']:
+                self.assertTrue(np.array_equal(minimal_cycles(data_set, sigma, method=method, packed=True),
+                                               minimal_cycles(data_set, sigma, method=method)))
+            self.assertTrue(np.array_equal(minimal_diamond(data_set, sigma, method='matrix', packed=True),
+                                           minimal_diamond(data_set, sigma, method='matrix')))
+        sigma = [0.01, 0.01]
+        data_set = np.vstack((np.zeros((1, 2)), np.random.rand(20, 2) + 0.5))
+        packed_small = minimal_small(data_set, sigma, method='matrix', packed=True)
+        self.assertEqual(len(packed_small), 1)
+        self.assertTrue(np.array_equal(packed_small, minimal_small(data_set, sigma, method='matrix')))
@@ -0,0 +1,33 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from optimization.ebo_stream import ebo
+from optimization.helpers import get_data_from_csv
+from optimization.pipeline import read_points, stream_ebo
+
+RESOURCES = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'resources')
+
+
+class PipelineTest(unittest.TestCase):
+    def test_read_points(self):
+        csv_path = os.path.join(RESOURCES, 'inputData.csv')
+        data_values = get_data_from_csv(csv_path, directory=None)
+        with tempfile.TemporaryDirectory() as directory:
+            npy_path = os.path.join(directory, 'inputData.npy')
+            np.save(npy_path, data_values)
+            for source in [csv_path, npy_path, iter(data_values), data_values.tolist()]:
+                blocks = list(read_points(source, chunk_size=4))
+                self.assertTrue(all(len(block) == 4 for block in blocks[:-1]))
+                self.assertTrue(np.array_equal(np.vstack(blocks), data_values))
+
+    def test_stream_ebo(self):
+        slack = [0.1, 0.2]
+        data_set = np.random.RandomState(0).rand(1000, 2)
+        reports = list(stream_ebo(iter(data_set), slack, chunk_size=64, checkpoint=3))
+        self.assertEqual([report[0] for report in reports], [192, 384, 576, 768, 960, 1000])
+        for number_points, decision, number_candidates in reports:
+            self.assertTrue(np.array_equal(decision, ebo(data_set[:number_points], slack)))
+            self.assertGreaterEqual(number_candidates, 1)
@@ -0,0 +1,57 @@
+import asyncio
+import unittest
+
+import numpy as np
+
+from optimization.ebo_stream import ebo
+from optimization.service import EBOService
+
+
+async def fake_producer(service, points):
+    for point in points:
+        await service.submit(point)
+
+
+async def run_service(data_set, slack, number_producers):
+    async with EBOService(slack, max_queue_size=8, max_batch_size=16) as service:
+        empty_decision = await service.current_decision()
+        await asyncio.gather(*[fake_producer(service, points)
+                               for points in np.array_split(data_set, number_producers)])
+        decision = await service.current_decision()
+    return service, empty_decision, decision
+
+
+class EBOServiceTest(unittest.TestCase):
+    def test_service(self):
+        slack = [0.1, 0.2]
+        data_set = np.round(np.random.RandomState(0).rand(500, 2), 2)
+        service, empty_decision, decision = asyncio.run(run_service(data_set, slack, 4))
+
+        self.assertIsNone(empty_decision)
+        self.assertTrue(np.array_equal(decision, ebo(data_set, slack)))
+        sizes = [stats['size'] for stats in service.batch_stats]
+        self.assertEqual(sum(sizes), len(data_set))
+        self.assertLessEqual(max(sizes), 16)
+        for stats in service.batch_stats:
+            self.assertLessEqual(stats['latency_p50'], stats['latency_p99'])
+
+    def test_invalid_point(self):
+        async def submit_invalid():
+            async with EBOService([0.1, 0.2]) as service:
+                await service.submit(['a', 'b'])
+
+        with self.assertRaises(ValueError):
+            asyncio.run(submit_invalid())
+
+    def test_failed_batch(self):
+        async def fail_batch():
+            service = EBOService([0.1, 0.2])
+            await service.start()
+            service.tracker.digest_many = lambda block: 1 / 0
+            await service.submit([0.5, 0.5])
+            with self.assertRaises(ZeroDivisionError):
+                await asyncio.wait_for(service.current_decision(), timeout=1)
+            with self.assertRaises(ZeroDivisionError):
+                await asyncio.wait_for(service.stop(), timeout=1)
+
+        asyncio.run(fail_batch())
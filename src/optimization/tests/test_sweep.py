@@ -0,0 +1,28 @@
+import unittest
+
+import numpy as np
+
+from optimization.minimals import adjacency_matrix, minimal_cycles
+from optimization.sweep import ThresholdSweep
+
+
+class ThresholdSweepTest(unittest.TestCase):
+    def test_adjacency_matrices(self):
+        data_set = np.round(np.random.RandomState(0).rand(25, 3), 1)
+        grids = [[0, 0.1, 0.3], [0.05, 0.2], [0, 0.1, 0.2, 0.5]]
+        sweep = ThresholdSweep(data_set, grids)
+        cells = 0
+        for levels, a_matrix in sweep.adjacency_matrices():
+            self.assertTrue(np.array_equal(a_matrix, adjacency_matrix(data_set, sweep.sigma(levels))))
+            cells += 1
+        self.assertEqual(cells, 24)
+
+    def test_count_minimals(self):
+        data_set = np.random.RandomState(1).rand(15, 2)
+        slacks = [i / 10 for i in range(0, 6)]
+        sweep = ThresholdSweep(data_set, [slacks, slacks])
+        for method in ['reach', 'scc']:
+            number_minimals = sweep.count_minimals(method)
+            for i, slack1 in enumerate(slacks):
+                for j, slack2 in enumerate(slacks):
+                    self.assertEqual(number_minimals[i, j], len(minimal_cycles(data_set, [slack1, slack2])))
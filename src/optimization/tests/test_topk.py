@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from optimization.ebo_stream import ebo
+from optimization.topk import ebo_topk, EBOTopKTracker
+
+
+def repeated_ebo(data_set, sigma, k):
+    """
+    Calls ebo k times, removing the decision each time.
+    """
+    remaining = data_set.copy()
+    ranking = []
+    for _ in range(min(k, len(data_set))):
+        decision = ebo(remaining, sigma)
+        ranking.append(decision)
+        position = np.flatnonzero(np.all(remaining == decision, axis=1))[0]
+        remaining = np.delete(remaining, position, axis=0)
+    return np.reshape(ranking, (-1, data_set.shape[1]))
+
+
+class TopKTest(unittest.TestCase):
+    def test_ebo_topk(self):
+        random_state = np.random.RandomState(0)
+        for _ in range(50):
+            data_set = np.round(random_state.rand(random_state.randint(1, 80), 3), 1)
+            sigma = np.round(random_state.rand(3) * 0.3, 1).tolist()
+            k = random_state.randint(1, 10)
+            self.assertTrue(np.array_equal(ebo_topk(data_set, sigma, k), repeated_ebo(data_set, sigma, k)))
+
+    def test_tracker(self):
+        random_state = np.random.RandomState(1)
+        for _ in range(30):
+            data_set = np.round(random_state.rand(200, 2), 1)
+            sigma = np.round(random_state.rand(2) * 0.3, 1).tolist()
+            k = random_state.randint(1, 6)
+            tracker = EBOTopKTracker(sigma, k)
+            for i in range(len(data_set)):
+                tracker.digest(data_set[i, :])
+                if i % 50 == 49:
+                    self.assertTrue(np.array_equal(tracker.decisions, repeated_ebo(data_set[:i + 1], sigma, k)))
+            self.assertLessEqual(len(tracker.candidates), len(data_set))
+            self.assertLess(tracker.number_comparisons, len(data_set) * tracker.max_candidates + 1)
+
+    def test_zero(self):
+        data_set = np.random.rand(20, 2)
+        tracker = EBOTopKTracker([0.1, 0.1], 0)
+        tracker.digest_many(data_set)
+        self.assertTrue(np.array_equal(tracker.decisions, ebo_topk(data_set, [0.1, 0.1], 0)))
+        self.assertEqual(tracker.decisions.shape, (0, 2))
@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+
+from optimization.ebo_stream import ebo
+from optimization.window import WindowedEBOTracker
+
+
+class WindowedEBOTrackerTest(unittest.TestCase):
+    def test_count_window(self):
+        random_state = np.random.RandomState(0)
+        for dim in [1, 2, 3]:
+            slack = np.round(random_state.rand(dim) * 0.3, 1).tolist()
+            data_set = np.round(random_state.rand(300, dim), 1)
+            tracker = WindowedEBOTracker(slack, window_size=25)
+            for i in range(len(data_set)):
+                tracker.digest(data_set[i, :])
+                self.assertTrue(np.array_equal(tracker.decision, ebo(data_set[max(0, i - 24):i + 1], slack)))
+            self.assertLessEqual(tracker.max_candidates, 25)
+
+    def test_time_window(self):
+        random_state = np.random.RandomState(1)
+        slack = [0.1, 0.2]
+        data_set = np.round(random_state.rand(300, 2), 1)
+        timestamps = np.cumsum(random_state.rand(300))
+        tracker = WindowedEBOTracker(slack, window_length=5.0)
+        for i in range(len(data_set)):
+            tracker.digest(data_set[i, :], timestamps[i])
+            window = data_set[(timestamps > timestamps[i] - 5.0) & (timestamps <= timestamps[i]), :]
+            self.assertTrue(np.array_equal(tracker.decision, ebo(window, slack)))
+
+        tracker.expire(timestamps[-1] + 5.0)
+        self.assertIsNone(tracker.decision)
+        with self.assertRaises(ValueError):
+            tracker.digest(data_set[0, :])
+
+    def test_resurrection(self):
+        tracker = WindowedEBOTracker([0.1, 0.1], window_size=2)
+        tracker.digest([0, 0])
+        tracker.digest([1, 1])
+        self.assertTrue(np.array_equal(tracker.decision, [0, 0]))
+        tracker.digest([2, 2])
+        self.assertTrue(np.array_equal(tracker.decision, [1, 1]))
+        self.assertEqual(len(tracker.candidates), 2)
@@ -0,0 +1,153 @@
+import heapq
+from typing import *
+
+import numpy as np
+
+
+def ebo_topk(data_set: np.ndarray, sigma: List[float], k: int):
+    """
+    Selects the k best points of a set X according to the EBO procedure, i.e. the decision of ebo on X, then the
+    decision of ebo on X without the first decision and so on.
+
+    After removing fewer than k elements, the smallest first objective is at most the k-th smallest first objective of
+    X. Only the elements within sigma_0 of it, found by a partial sort, can survive the first objective in any of the k
+    passes, and the survivor sets on them are the same as on X.
+    :param data_set: input set X
+    :param sigma: threshold parameters, non-negative
+    :param k: number of points
+    :return: array of at most k points, best first
+    """
+    n = len(data_set)
+    if k >= n:
+        pool = np.arange(n)
+    else:
+        kth_first = np.partition(data_set[:, 0], k - 1)[k - 1]
+        pool = np.flatnonzero(data_set[:, 0] <= kth_first + sigma[0])
+
+    ranking = []
+    for _ in range(min(k, n)):
+        position = _ebo_index(data_set[pool, :], sigma)
+        ranking.append(pool[position])
+        pool = np.delete(pool, position)
+
+    return data_set[ranking, :]
+
+
+def _ebo_index(data_set: np.ndarray, sigma: List[float]):
+    """
+    Index of the decision of ebo on a set X.
+    """
+    index = np.arange(len(data_set))
+    dim = len(sigma)
+
+    # Survivor set method on X
+    for i in range(dim):
+        if len(index) == 1:
+            return index[0]
+        values = data_set[index, i]
+        index = index[values <= np.amin(values) + sigma[i]]
+
+    # lexicographic selection on survivor set
+    for i in range(dim):
+        if len(index) == 1:
+            return index[0]
+        values = data_set[index, i]
+        index = index[np.invert(values > np.amin(values))]
+
+    return index[0]
+
+
+class EBOTopKTracker:
+    """EBOTopKTracker which keeps track of the candidates for the k best points of a stream of input elements, see
+    ebo_topk.
+
+    An element y beats x if x is never selected while y is present: x_0 > y_0 + sigma_0, or y <= x in every objective
+    and y differs from x or arrived earlier. Beating is transitive, so an element beaten by k elements is never among
+    the k best points of any superset and is discarded. The candidates are the elements beaten by fewer than k elements
+    and each candidate stores the number of elements beating it. A bounded heap of the k smallest first objectives seen
+    so far rejects most elements with a single comparison.
+    """
+
+    def __init__(self, slack: List[float], k: int):
+        self.slack = slack
+        self.k = k
+        self.dim = len(slack)
+        self.number_comparisons = 0
+        self.max_candidates = 0
+
+        # candidates in order of arrival and the number of elements beating each of them
+        self._candidates = np.zeros((0, self.dim))
+        self._beaten = np.zeros(0, dtype=int)
+
+        # max-heap of the k smallest first objectives, stored negated
+        self._smallest_first = []
+
+    @property
+    def candidates(self):
+        """
+        Current candidates in order of arrival.
+        """
+        return self._candidates
+
+    @property
+    def decisions(self):
+        """
+        The k best points of all elements digested so far, best first.
+        """
+        return ebo_topk(self._candidates, self.slack, self.k)
+
+    def digest(self, x: np.ndarray):
+        """
+        Updates the tracker when a new input element is available.
+        :param x: new input element
+        :return:
+        """
+        current = np.reshape(x, (self.dim,))
+
+        # every element is beaten by at least k = 0 elements, as in ebo_topk nothing is kept
+        if self.k == 0:
+            return
+
+        self._update_smallest_first(current[0])
+
+        # k elements discard the applicant on the first objective
+        if len(self._smallest_first) == self.k and current[0] > -self._smallest_first[0] + self.slack[0]:
+            self.number_comparisons += 1
+            return
+
+        candidates = self._candidates
+        self.number_comparisons += len(candidates)
+
+        beaten = np.count_nonzero((current[0] > candidates[:, 0] + self.slack[0]) |
+                                  np.all(candidates <= current, axis=1))
+        if beaten >= self.k:
+            return
+
+        # candidates beaten by the applicant as well
+        beats = (candidates[:, 0] > current[0] + self.slack[0]) | \
+                (np.all(current <= candidates, axis=1) & np.any(current != candidates, axis=1))
+        self._beaten = self._beaten + beats
+        keep = self._beaten < self.k
+
+        self._candidates = np.vstack((candidates[keep, :], current))
+        self._beaten = np.append(self._beaten[keep], beaten)
+        self.max_candidates = max(self.max_candidates, len(self._candidates))
+
+    def digest_many(self, block: np.ndarray):
+        """
+        Updates the tracker with a block of input elements, equivalent to calling digest for each row in order.
+        :param block: applicant points, one per row
+        :return:
+        """
+        block = np.reshape(block, (-1, self.dim))
+        for i in range(len(block)):
+            self.digest(block[i, :])
+
+    def _update_smallest_first(self, value: float):
+        """
+        Adds a first objective to the heap of the k smallest first objectives.
+        """
+        if len(self._smallest_first) < self.k:
+            heapq.heappush(self._smallest_first, -value)
+        elif value < -self._smallest_first[0]:
+            heapq.heapreplace(self._smallest_first, -value)
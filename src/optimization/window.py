@@ -0,0 +1,92 @@
+from typing import *
+
+import numpy as np
+
+from .ebo_stream import ebo
+
+
+class WindowedEBOTracker:
+    """WindowedEBOTracker which keeps track of the EBO decision over a sliding window of a stream of input elements,
+    either the last window_size elements or the elements of the last window_length time units.
+
+    A newer element x makes an older element y irrelevant if y_0 > x_0 + sigma_0 or y >= x in every objective: y is
+    never the decision while x is present, and x leaves the window after y. The tracker keeps the elements of the
+    window which no newer element of the window makes irrelevant, in order of arrival. An applicant is always kept and
+    removes the elements it makes irrelevant, expiry removes elements from the front. An element which is worse than an
+    older one is kept, so it takes over as soon as the older element leaves the window.
+    """
+
+    def __init__(self, slack: List[float], window_size: int = None, window_length: float = None):
+        if (window_size is None) == (window_length is None):
+            raise ValueError('Exactly one of window_size and window_length has to be given')
+
+        self.slack = slack
+        self.dim = len(slack)
+        self.window_size = window_size
+        self.window_length = window_length
+        self.number_comparisons = 0
+        self.max_candidates = 0
+
+        # candidates in order of arrival with their arrival number and timestamp
+        self._candidates = np.zeros((0, self.dim))
+        self._arrival = np.zeros(0, dtype=int)
+        self._timestamps = np.zeros(0)
+        self._number_arrivals = 0
+
+    @property
+    def candidates(self):
+        """
+        Current candidates in order of arrival.
+        """
+        return self._candidates
+
+    @property
+    def decision(self):
+        """
+        EBO decision on the current window, None if the window is empty.
+        """
+        if len(self._candidates) == 0:
+            return None
+        return ebo(self._candidates, self.slack)
+
+    def digest(self, x: np.ndarray, timestamp: float = None):
+        """
+        Updates the tracker when a new input element is available and expires the elements which left the window.
+        :param x: new input element
+        :param timestamp: time of arrival, required for a time window and non-decreasing
+        :return:
+        """
+        if self.window_length is not None and timestamp is None:
+            raise ValueError('A time window requires a timestamp for every input element')
+
+        current = np.reshape(x, (self.dim,))
+        self._number_arrivals += 1
+        self.expire(timestamp)
+
+        candidates = self._candidates
+        self.number_comparisons += len(candidates)
+
+        irrelevant = (candidates[:, 0] > current[0] + self.slack[0]) | np.all(candidates >= current, axis=1)
+        keep = np.invert(irrelevant)
+
+        self._candidates = np.vstack((candidates[keep, :], current))
+        self._arrival = np.append(self._arrival[keep], self._number_arrivals - 1)
+        self._timestamps = np.append(self._timestamps[keep], np.nan if timestamp is None else timestamp)
+        self.max_candidates = max(self.max_candidates, len(self._candidates))
+
+    def expire(self, now: float = None):
+        """
+        Removes the candidates which left the window.
+        :param now: current time, only used by a time window
+        :return:
+        """
+        if self.window_size is not None:
+            start = np.searchsorted(self._arrival, self._number_arrivals - self.window_size, side='left')
+        elif now is not None:
+            start = np.searchsorted(self._timestamps, now - self.window_length, side='right')
+        else:
+            return
+
+        self._candidates = self._candidates[start:, :]
+        self._arrival = self._arrival[start:]
+        self._timestamps = self._timestamps[start:]
@@ -4,27 +4,34 @@ import matplotlib.pyplot as plt
 import matplotlib2tikz
 import numpy as np
 
-from optimization.ebo_stream import EBOStreamTracker
+from optimization.ebo_stream import EBOStreamTracker, DigestStats
+from optimization.experiments import run_experiment
 from optimization.helpers import create_random_points
 
 
-def execute(n, dim, executions, sigma):
-    number_max_candidates = []
-    number_comps = []
-    for j in range(executions):
-        mintracker_exact = EBOStreamTracker(sigma)
-        data_set = create_random_points(dim, n)
-        for i in np.arange(len(data_set)):
-            x = np.reshape(data_set[i, :], (1, dim))
+def trial(cell, random_state):
+    """
+    Streams one random data set through the EBO tracker.
+    :param cell: (n, dim, sigma)
+    :param random_state: random number generator of this execution
+    :return: maximal candidate set size, number of comparisons and the share of inputs rejected on the first objective,
+    rejected by dominance and accepted
+    """
+    n, dim, sigma = cell
+    mintracker_exact = EBOStreamTracker(sigma, stats=DigestStats())
+    data_set = create_random_points(dim, n, random_state)
+    for i in np.arange(len(data_set)):
+        x = np.reshape(data_set[i, :], (1, dim))
 
-            mintracker_exact.digest(x)
+        mintracker_exact.digest(x)
 
-        cand_set_size = mintracker_exact.max_candidates
-        number_max_candidates.append(cand_set_size)
-        number_comps.append(mintracker_exact.number_comparisons)
+    stats = mintracker_exact.stats.as_dict()
+    return (mintracker_exact.max_candidates, mintracker_exact.number_comparisons,
+            stats['rejected_first_objective'] / n, stats['rejected_dominated'] / n, stats['accepted'] / n)
 
-    return np.min(number_max_candidates), np.mean(number_max_candidates), np.max(number_max_candidates), \
-           np.min(number_comps), np.mean(number_comps), np.max(number_comps)
+
+def execute(n, dim, executions, sigma):
+    return run_experiment(trial, [(n, dim, sigma)], executions)[0]
 
 
 def make_plots(numbers_min, numbers_mean, numbers_max, samples, title, plot_type):
@@ -70,6 +77,37 @@ def make_plots(numbers_min, numbers_mean, numbers_max, samples, title, plot_type
     plt.close()
 
 
+def make_outcome_plot(outcomes_mean, samples, plot_type):
+    """
+    Plots the mean share of each digest outcome versus the sample size.
+    """
+    plt.style.use("ggplot")
+
+    plt.xlabel("Sample size")
+    plt.ylabel("Share of inputs")
+
+    for label, color in zip(['Rejected on first objective', 'Rejected by dominance', 'Accepted'],
+                            ['green', 'blue', 'red']):
+        plt.plot(samples, outcomes_mean[label], linewidth=1, color=color, label=label)
+
+    plt.title('Digest outcomes versus sample size', pad=10)
+    plt.legend(loc='center right')
+
+    plt.grid(True)
+
+    file_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'plots', 'candidate_set_size')
+    if not os.path.isdir(file_path):
+        os.makedirs(file_path)
+
+    if plot_type == 'png':
+        plt.savefig(os.path.join(file_path, 'digest_outcomes.png'))
+
+    if plot_type == 'tikz':
+        matplotlib2tikz.save(file_path + '/' + "digest_outcomes.tex")
+
+    plt.close()
+
+
 def main():
     dim = 3
 
@@ -91,12 +129,19 @@ def main():
     comps_mean = []
     comps_max = []
 
-    for i in samples:
-        n = i
-        slack = 0.2
-        sigma = [slack, slack, slack]
+    outcomes_mean = {'Rejected on first objective': [], 'Rejected by dominance': [], 'Accepted': []}
+
+    slack = 0.2
+    sigma = [slack, slack, slack]
+
+    cells = [(n, dim, sigma) for n in samples]
+    results = run_experiment(trial, cells, executions)
 
-        min_size, mean_size, max_size, min_comps, mean_comps, max_comps = execute(n, dim, executions, sigma)
+    for result in results:
+        min_size, mean_size, max_size, min_comps, mean_comps, max_comps = result[:6]
+        outcomes_mean['Rejected on first objective'].append(result[7])
+        outcomes_mean['Rejected by dominance'].append(result[10])
+        outcomes_mean['Accepted'].append(result[13])
 
         number_min.append(min_size)
         number_mean.append(mean_size)
@@ -110,6 +155,7 @@ def main():
 
     make_plots(number_min, number_mean, number_max, samples, 'candidate_set_size', plot_type)
     make_plots(comps_min, comps_mean, comps_max, samples, "number_comparisons", plot_type)
+    make_outcome_plot(outcomes_mean, samples, plot_type)
 
 
 if __name__ == "__main__":